@@ -5,6 +5,9 @@ Stores and retrieves meeting information using vector embeddings.
 
 import asyncio
 import json
+import re
+import time
+import uuid
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 from dataclasses import dataclass, field
@@ -13,6 +16,10 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Numbers in a question (meeting ids, dates, counts); cached answers are only
+# reused when these match, since embeddings barely separate "meeting 3" from "meeting 4"
+_NUMBER = re.compile(r"\d+")
+
 
 @dataclass
 class MemoryDocument:
@@ -41,9 +48,15 @@ class MeetingMemory:
         self.enabled = adv_config.get("rag_memory_enabled", True)
         self.persist_dir = Path(adv_config.get("memory_persist_dir", "./data/memory"))
         self.collection_name = adv_config.get("memory_collection", "meeting_memory")
+        self.qa_cache_enabled = adv_config.get("qa_cache_enabled", False)
+        self.qa_cache_threshold = adv_config.get("qa_cache_similarity_threshold", 0.92)
+        self.qa_cache_ttl = adv_config.get("qa_cache_ttl_seconds", 86400)
+        self.cag_max_chars = adv_config.get("memory_cag_max_chars", 32000)
         
         self._client = None
         self._collection = None
+        self._qa_cache = None
+        self._static_context: Optional[str] = None
         self._embedding_model = None
         self._initialized = False
 
@@ -72,6 +85,13 @@ class MeetingMemory:
                 metadata={"description": "Sunny AI Meeting Memory"}
             )
             
+            # Answers to past questions, searched by cosine similarity
+            if self.qa_cache_enabled:
+                self._qa_cache = self._client.get_or_create_collection(
+                    name=f"{self.collection_name}_qa_cache",
+                    metadata={"hnsw:space": "cosine"}
+                )
+            
             # Try to load embedding model
             await self._load_embedding_model()
             
@@ -215,6 +235,10 @@ class MeetingMemory:
                 )
             
             logger.info(f"Stored {len(documents)} documents for meeting {meeting_id}")
+            
+            # Cached answers and context may no longer reflect the full meeting history
+            self._clear_qa_cache()
+            self._static_context = None
 
         return len(documents)
 
@@ -223,9 +247,13 @@ class MeetingMemory:
         query: str,
         n_results: int = 5,
         doc_type: Optional[str] = None,
-        meeting_id: Optional[int] = None
+        meeting_id: Optional[int] = None,
+        query_embedding: Optional[List[List[float]]] = None
     ) -> List[SearchResult]:
-        """Search meeting memory."""
+        """Search meeting memory.
+        
+        Pass query_embedding when the caller has already encoded the query.
+        """
         if not self._initialized:
             await self.initialize()
             if not self._initialized:
@@ -242,9 +270,8 @@ class MeetingMemory:
 
         try:
             # Get query embedding
-            query_embedding = None
-            if self._embedding_model:
-                query_embedding = self._embedding_model.encode([query]).tolist()
+            if query_embedding is None:
+                query_embedding = self._get_embeddings([query])
 
             # Search
             if query_embedding:
@@ -293,16 +320,37 @@ class MeetingMemory:
         self,
         question: str,
         llm_pipeline: Any,
-        n_context: int = 5
+        n_context: int = 5,
+        force_refresh: bool = False
     ) -> str:
-        """Answer a question using RAG."""
+        """Answer a question using RAG.
+        
+        Answers are reused for questions close enough to one asked before,
+        unless force_refresh is set.
+        """
         if not self._initialized or not llm_pipeline:
             return "Memory system not available."
 
+        question_embedding = self._get_embeddings([question])
+        if not force_refresh:
+            cached = self._get_cached_answer(question, question_embedding)
+            if cached:
+                return cached
+
+        # Summaries, key points, decisions and action items form a static
+        # context that is sent first on every question, so the provider can
+        # reuse its prefill; retrieval then only needs transcript excerpts
+        static_context = self._get_static_context()
+
         # Search for relevant context
-        results = await self.search(question, n_results=n_context)
+        results = await self.search(
+            question,
+            n_results=n_context,
+            doc_type="transcript" if static_context else None,
+            query_embedding=question_embedding
+        )
         
-        if not results:
+        if not results and not static_context:
             return "No relevant information found in meeting history."
 
         # Build context
@@ -316,7 +364,19 @@ class MeetingMemory:
         context = "\n\n".join(context_parts)
 
         # Generate answer
-        prompt = f"""Based on the following meeting history, answer the question.
+        if static_context:
+            prompt = f"""Answer questions about past meetings using the meeting history below.
+Answer based only on the information provided. If the information is not available, say so.
+
+Meeting History:
+{static_context}
+
+Relevant Transcript Excerpts:
+{context or "None"}
+
+Question: {question}"""
+        else:
+            prompt = f"""Based on the following meeting history, answer the question.
 
 Meeting History:
 {context}
@@ -327,11 +387,108 @@ Answer based only on the information provided. If the information is not availab
 
         try:
             answer = await llm_pipeline._call_llm(prompt)
+            self._cache_answer(question, question_embedding, answer)
             return answer
         except Exception as e:
             logger.error(f"LLM query failed: {e}")
             return "Failed to generate answer."
 
+    def _get_static_context(self) -> Optional[str]:
+        """Build the static meeting-history context, or None if it is too large.
+
+        Documents are ordered by meeting id, so a new meeting only extends
+        the context and the earlier prefix stays identical.
+        """
+        if self._static_context is not None:
+            return self._static_context or None
+
+        try:
+            results = self._collection.get(
+                where={"doc_type": {"$in": ["summary", "key_point", "decision", "action_item"]}},
+                include=["documents", "metadatas"]
+            )
+        except Exception as e:
+            logger.warning(f"Could not load static memory context: {e}")
+            return None
+
+        entries = sorted(
+            zip(results['ids'], results['documents'], results['metadatas']),
+            key=lambda entry: (entry[2].get('meeting_id', 0), entry[0])
+        )
+        context = "\n".join(
+            f"[Meeting {metadata.get('meeting_id', 0)}, {metadata.get('doc_type', 'unknown')}]: {doc}"
+            for _, doc, metadata in entries
+        )
+
+        # An empty string marks "built but unusable" so it is not rebuilt per question
+        self._static_context = context if len(context) <= self.cag_max_chars else ""
+        return self._static_context or None
+
+    def _get_cached_answer(
+        self,
+        question: str,
+        question_embedding: Optional[List[List[float]]]
+    ) -> Optional[str]:
+        """Return a stored answer to a near-duplicate question, if one is fresh."""
+        if self._qa_cache is None or self._qa_cache.count() == 0:
+            return None
+
+        try:
+            query = {"query_embeddings": question_embedding} if question_embedding else {"query_texts": [question]}
+            results = self._qa_cache.query(
+                **query,
+                n_results=1,
+                where={"created_at": {"$gte": time.time() - self.qa_cache_ttl}}
+            )
+        except Exception as e:
+            logger.warning(f"QA cache lookup failed: {e}")
+            return None
+
+        if not results or not results['ids'] or not results['ids'][0]:
+            return None
+
+        similarity = 1 - results['distances'][0][0]
+        if similarity < self.qa_cache_threshold:
+            return None
+        
+        cached_question = results['documents'][0][0] if results.get('documents') else ""
+        if set(_NUMBER.findall(question)) != set(_NUMBER.findall(cached_question or "")):
+            return None
+
+        logger.info(f"QA cache hit (similarity {similarity:.3f})")
+        return results['metadatas'][0][0].get("answer")
+
+    def _cache_answer(
+        self,
+        question: str,
+        question_embedding: Optional[List[List[float]]],
+        answer: str
+    ) -> None:
+        """Store an answer for reuse by similar questions."""
+        if self._qa_cache is None:
+            return
+
+        try:
+            kwargs = {"embeddings": question_embedding} if question_embedding else {}
+            self._qa_cache.add(
+                ids=[uuid.uuid4().hex],
+                documents=[question],
+                metadatas=[{"answer": answer, "created_at": time.time()}],
+                **kwargs
+            )
+        except Exception as e:
+            logger.warning(f"Could not cache answer: {e}")
+
+    def _clear_qa_cache(self) -> None:
+        """Drop all cached answers."""
+        if self._qa_cache is None or self._qa_cache.count() == 0:
+            return
+
+        try:
+            self._qa_cache.delete(ids=self._qa_cache.get(include=[])['ids'])
+        except Exception as e:
+            logger.warning(f"Could not clear QA cache: {e}")
+
     def _chunk_text(
         self,
         text: str,
@@ -393,6 +550,8 @@ Answer based only on the information provided. If the information is not availab
                 where={"meeting_id": meeting_id}
             )
             logger.info(f"Deleted meeting {meeting_id} from memory")
+            self._clear_qa_cache()
+            self._static_context = None
             return True
         except Exception as e:
             logger.error(f"Failed to delete meeting: {e}")
@@ -3,13 +3,12 @@ FastAPI REST API Server
 Provides HTTP interface for Sunny AI.
 """
 
-import asyncio
-from datetime import datetime
 from typing import Optional, List
 from pathlib import Path
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse
 import structlog
 
 logger = structlog.get_logger(__name__)
@@ -17,6 +16,8 @@ logger = structlog.get_logger(__name__)
 
 # Request/Response Models
 class MeetingRequest(BaseModel):
+    model_config = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
+
     meeting_url: str
     recipient_email: EmailStr
     send_email: bool = True
@@ -67,8 +68,10 @@ def create_app(controller=None) -> FastAPI:
     app = FastAPI(
         title="Sunny AI",
         description="Autonomous Meeting Attending & Summarization Agent",
-        version="1.0.0"
+        version="1.0.0",
+        default_response_class=ORJSONResponse
     )
+    app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
     
     if controller:
         _app_state["controller"] = controller
@@ -109,11 +112,12 @@ def create_app(controller=None) -> FastAPI:
                 send_email=request.send_email
             )
             
-            return MeetingResponse(
-                session_id=session_id,
-                status="joining",
-                message="Meeting session started. Sunny AI is joining the meeting."
-            )
+            # Plain dict; response_model only documents the shape
+            return ORJSONResponse({
+                "session_id": session_id,
+                "status": "joining",
+                "message": "Meeting session started. Sunny AI is joining the meeting."
+            })
             
         except Exception as e:
             logger.error(f"Failed to join meeting: {e}")
@@ -133,7 +137,8 @@ def create_app(controller=None) -> FastAPI:
             if not status:
                 raise HTTPException(status_code=404, detail="Session not found")
             
-            return MeetingStatus(**status)
+            # Validate once here; a Response return is not re-validated against response_model
+            return ORJSONResponse(MeetingStatus(**status).model_dump())
             
         except HTTPException:
             raise
@@ -171,7 +176,7 @@ def create_app(controller=None) -> FastAPI:
             if not transcript:
                 raise HTTPException(status_code=404, detail="Transcript not available")
             
-            return TranscriptResponse(**transcript)
+            return ORJSONResponse(TranscriptResponse(**transcript).model_dump())
             
         except HTTPException:
             raise
@@ -193,7 +198,7 @@ def create_app(controller=None) -> FastAPI:
             if not summary:
                 raise HTTPException(status_code=404, detail="Summary not available")
             
-            return SummaryResponse(**summary)
+            return ORJSONResponse(SummaryResponse(**summary).model_dump())
             
         except HTTPException:
             raise
@@ -5,6 +5,7 @@ Main orchestration module that coordinates all components.
 
 import asyncio
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any, List
@@ -13,7 +14,7 @@ import structlog
 
 from meeting_bot.recorder import MeetingRecorder, MeetingSession, RecordingState
 from transcription.whisper_engine import WhisperEngine, TranscriptionResult
-from summarization.llm_pipeline import LLMPipeline, MeetingSummary
+from summarization.llm_pipeline import LLMPipeline, MeetingSummary, ActionItem
 from pdf.pdf_generator import PDFGenerator
 from email_sender.gmail_sender import GmailSender
 from database.storage import MeetingStorage, MeetingRecord
@@ -62,7 +63,7 @@ except ImportError as e:
         async def initialize(self): pass
         async def store_meeting(self, **kwargs): pass
         async def search(self, query, n_results, doc_type): return []
-        async def query_with_llm(self, question, summarizer): return "Memory not available"
+        async def query_with_llm(self, question, summarizer, force_refresh=False): return "Memory not available"
 
 logger = structlog.get_logger(__name__)
 
@@ -93,6 +94,9 @@ class SunnyAIController:
         # Session tracking
         self._sessions: Dict[int, Dict[str, Any]] = {}
         self._session_counter = 0
+        # Keyed by session id; None holds subscribers to every session
+        self._status_subscribers: Dict[Optional[int], List[asyncio.Queue]] = {}
+        self._pdf_locks: Dict[int, asyncio.Lock] = {}
 
     async def initialize(self) -> None:
         """Initialize all components."""
@@ -119,6 +123,9 @@ class SunnyAIController:
         except Exception as e:
             logger.error(f"LLM check failed: {e}")
         
+        # Launch the meeting browser in the background so the first join is warm
+        asyncio.create_task(self.recorder.warm_up())
+        
         # Initialize advanced features with error handling
         if ADVANCED_FEATURES_AVAILABLE:
             adv_config = self.config.get("advanced_features", {})
@@ -180,6 +187,46 @@ class SunnyAIController:
         
         return session_id
 
+    def subscribe_status(self, session_id: Optional[int] = None) -> asyncio.Queue:
+        """Subscribe to status transitions of a session, or of all sessions.
+
+        The returned queue receives the current status immediately and a
+        status dict on every subsequent transition. With session_id None it
+        receives the status of every in-memory session.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._status_subscribers.setdefault(session_id, []).append(queue)
+
+        if session_id is None:
+            sessions = list(self._sessions.values())
+        else:
+            sessions = [self._sessions[session_id]] if session_id in self._sessions else []
+        for session in sessions:
+            queue.put_nowait(self._build_status(session))
+
+        return queue
+
+    def unsubscribe_status(self, session_id: Optional[int], queue: asyncio.Queue) -> None:
+        """Stop delivering status transitions to a queue."""
+        subscribers = self._status_subscribers.get(session_id, [])
+        if queue in subscribers:
+            subscribers.remove(queue)
+        if not subscribers:
+            self._status_subscribers.pop(session_id, None)
+
+    def _set_status(self, session: Dict[str, Any], status: str) -> None:
+        """Update a session status and notify subscribers."""
+        session["status"] = status
+
+        subscribers = (
+            self._status_subscribers.get(session["id"], [])
+            + self._status_subscribers.get(None, [])
+        )
+        if subscribers:
+            snapshot = self._build_status(session)
+            for queue in subscribers:
+                queue.put_nowait(snapshot)
+
     async def _run_session(self, session_id: int) -> None:
         """Run the complete meeting session workflow."""
         session = self._sessions.get(session_id)
@@ -188,19 +235,19 @@ class SunnyAIController:
         
         try:
             # Step 1: Join meeting and record
-            session["status"] = "joining"
+            self._set_status(session, "joining")
             logger.info(f"Session {session_id}: Joining meeting")
             
             meeting_session = await self.recorder.start_session(session["meeting_url"])
             session["meeting_session"] = meeting_session
             
             if meeting_session.state == RecordingState.ERROR:
-                session["status"] = "error"
+                self._set_status(session, "error")
                 session["error"] = meeting_session.error_message
                 logger.error(f"Session {session_id}: Failed to join meeting")
                 return
             
-            session["status"] = "recording"
+            self._set_status(session, "recording")
             logger.info(f"Session {session_id}: Recording started")
             
             # Wait for meeting to end
@@ -208,12 +255,12 @@ class SunnyAIController:
                 await asyncio.sleep(5)
             
             # Step 2: Process recording
-            session["status"] = "processing"
+            self._set_status(session, "processing")
             await self._process_recording(session_id)
             
         except Exception as e:
             logger.error(f"Session {session_id} error: {e}")
-            session["status"] = "error"
+            self._set_status(session, "error")
             session["error"] = str(e)
 
     async def _process_recording(self, session_id: int) -> None:
@@ -226,13 +273,13 @@ class SunnyAIController:
         
         if not meeting_session.audio_file or not meeting_session.audio_file.exists():
             logger.error(f"Session {session_id}: No audio file found")
-            session["status"] = "error"
+            self._set_status(session, "error")
             session["error"] = "No audio file recorded"
             return
         
         try:
             # Step 2: Transcribe audio
-            session["status"] = "transcribing"
+            self._set_status(session, "transcribing")
             logger.info(f"Session {session_id}: Transcribing audio")
             
             transcript_result = await self.transcriber.transcribe(meeting_session.audio_file)
@@ -242,7 +289,7 @@ class SunnyAIController:
             transcript_segments = getattr(transcript_result, 'segments', [])
             
             # Step 3: Speaker Diarization
-            session["status"] = "diarizing"
+            self._set_status(session, "diarizing")
             logger.info(f"Session {session_id}: Speaker diarization")
             
             diarization_result = await self.diarizer.diarize(meeting_session.audio_file)
@@ -256,7 +303,7 @@ class SunnyAIController:
                 session["aligned_segments"] = aligned_segments
             
             # Step 4: Topic Segmentation
-            session["status"] = "segmenting_topics"
+            self._set_status(session, "segmenting_topics")
             logger.info(f"Session {session_id}: Topic segmentation")
             
             topic_result = await self.topic_segmenter.segment_topics(
@@ -265,7 +312,7 @@ class SunnyAIController:
             session["topics"] = topic_result
             
             # Step 5: Sentiment Analysis
-            session["status"] = "analyzing_sentiment"
+            self._set_status(session, "analyzing_sentiment")
             logger.info(f"Session {session_id}: Sentiment analysis")
             
             sentiment_result = await self.sentiment_analyzer.analyze(
@@ -274,14 +321,14 @@ class SunnyAIController:
             session["sentiment"] = sentiment_result
             
             # Step 6: Generate summary
-            session["status"] = "summarizing"
+            self._set_status(session, "summarizing")
             logger.info(f"Session {session_id}: Generating summary")
             
             summary = await self.summarizer.summarize_transcript(transcript_result.text)
             session["summary"] = summary
             
             # Step 7: Extract Action Items (enhanced)
-            session["status"] = "extracting_actions"
+            self._set_status(session, "extracting_actions")
             logger.info(f"Session {session_id}: Extracting action items")
             
             action_result = await self.action_extractor.extract(
@@ -290,7 +337,7 @@ class SunnyAIController:
             session["action_items"] = action_result
             
             # Step 8: Generate Analytics
-            session["status"] = "generating_analytics"
+            self._set_status(session, "generating_analytics")
             logger.info(f"Session {session_id}: Generating analytics")
             
             duration_seconds = meeting_session.metadata.get("duration_seconds", 0)
@@ -309,10 +356,10 @@ class SunnyAIController:
             session["analytics"] = metrics
             
             # Step 9: Generate PDF (enhanced)
-            session["status"] = "generating_pdf"
+            self._set_status(session, "generating_pdf")
             logger.info(f"Session {session_id}: Generating PDF")
             
-            pdf_path = self.pdf_generator.generate_report(
+            pdf_path = await self.pdf_generator.generate_report_async(
                 summary=summary,
                 platform=meeting_session.platform.value,
                 duration=meeting_session.metadata.get("duration_formatted", "Unknown"),
@@ -349,7 +396,7 @@ class SunnyAIController:
             
             # Step 11: Store in RAG Memory
             if self.memory._initialized:
-                session["status"] = "storing_memory"
+                self._set_status(session, "storing_memory")
                 logger.info(f"Session {session_id}: Storing in memory")
                 
                 await self.memory.store_meeting(
@@ -365,7 +412,7 @@ class SunnyAIController:
                 )
             
             # Step 12: Generate Follow-up Email
-            session["status"] = "generating_followup"
+            self._set_status(session, "generating_followup")
             logger.info(f"Session {session_id}: Generating follow-up email")
             
             followup_email = await self.followup_generator.generate(
@@ -378,7 +425,7 @@ class SunnyAIController:
             
             # Step 13: Send email
             if session["send_email"]:
-                session["status"] = "sending_email"
+                self._set_status(session, "sending_email")
                 logger.info(f"Session {session_id}: Sending email")
                 
                 try:
@@ -398,12 +445,12 @@ class SunnyAIController:
                 except Exception as e:
                     logger.error(f"Failed to send email: {e}")
             
-            session["status"] = "completed"
+            self._set_status(session, "completed")
             logger.info(f"Session {session_id}: Completed successfully")
             
         except Exception as e:
             logger.error(f"Session {session_id} processing error: {e}")
-            session["status"] = "error"
+            self._set_status(session, "error")
             session["error"] = str(e)
 
 
@@ -416,7 +463,7 @@ class SunnyAIController:
         if session["status"] == "recording":
             await self.recorder.end_session()
         
-        session["status"] = "stopped"
+        self._set_status(session, "stopped")
         logger.info(f"Session {session_id}: Stopped")
 
     async def get_session_status(self, session_id: int) -> Optional[Dict[str, Any]]:
@@ -441,11 +488,15 @@ class SunnyAIController:
                     "email_sent": record.email_sent
                 }
             return None
-        
+
+        return self._build_status(session)
+
+    def _build_status(self, session: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the status dict for an in-memory session."""
         meeting_session = session.get("meeting_session")
-        
+
         return {
-            "session_id": session_id,
+            "session_id": session["id"],
             "status": session["status"],
             "platform": meeting_session.platform.value if meeting_session else None,
             "start_time": meeting_session.start_time.isoformat() if meeting_session and meeting_session.start_time else None,
@@ -518,10 +569,58 @@ class SunnyAIController:
         
         return None
 
+    async def ensure_pdf(self, session_id: int) -> Optional[str]:
+        """Get the PDF path for a session, re-rendering the report if the file is gone.
+        
+        Rendering runs in a worker thread, and the new path is recorded so
+        later downloads reuse the file.
+        """
+        async with self._pdf_locks.setdefault(session_id, asyncio.Lock()):
+            pdf_path = await self.get_pdf_path(session_id)
+            if pdf_path and await asyncio.to_thread(os.path.exists, pdf_path):
+                return pdf_path
+            
+            session = self._sessions.get(session_id)
+            if session and session.get("summary"):
+                meeting_session = session.get("meeting_session")
+                pdf_path = await self.pdf_generator.generate_report_async(
+                    summary=session["summary"],
+                    platform=meeting_session.platform.value if meeting_session else "Unknown",
+                    duration=meeting_session.metadata.get("duration_formatted", "Unknown") if meeting_session else "Unknown",
+                    meeting_date=meeting_session.start_time if meeting_session else None,
+                    diarization=session.get("diarization"),
+                    topics=session.get("topics"),
+                    sentiment=session.get("sentiment"),
+                    action_items=session.get("action_items"),
+                    analytics=session.get("analytics")
+                )
+                session["pdf_path"] = pdf_path
+                return str(pdf_path)
+            
+            record = await self.storage.get_meeting(session_id)
+            if not record or not record.summary_json:
+                return None
+            
+            summary_data = json.loads(record.summary_json)
+            summary = MeetingSummary(
+                executive_summary=summary_data.get("executive_summary", ""),
+                key_discussion_points=summary_data.get("key_points", []),
+                decisions_made=summary_data.get("decisions", []),
+                action_items=[ActionItem(**item) for item in summary_data.get("action_items", [])],
+                raw_transcript=record.transcript or ""
+            )
+            pdf_path = await self.pdf_generator.generate_report_async(
+                summary=summary,
+                platform=record.platform,
+                duration=f"{record.duration_seconds:.0f}s",
+                meeting_date=datetime.fromisoformat(record.start_time) if record.start_time else None
+            )
+            record.pdf_path = str(pdf_path)
+            await self.storage.update_meeting(record)
+            return record.pdf_path
+
     async def get_recent_meetings(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get recent meeting records."""
-        records = await self.storage.get_recent_meetings(limit)
-        
         return [
             {
                 "id": r.id,
@@ -532,7 +631,7 @@ class SunnyAIController:
                 "email_sent": r.email_sent,
                 "created_at": r.created_at
             }
-            for r in records
+            async for r in self.storage.iter_recent_meetings(limit)
         ]
 
     async def get_analytics(self, session_id: int) -> Optional[Dict[str, Any]]:
@@ -666,12 +765,14 @@ class SunnyAIController:
             for r in results
         ]
 
-    async def ask_memory(self, question: str) -> str:
+    async def ask_memory(self, question: str, force_refresh: bool = False) -> str:
         """Ask a question about past meetings using RAG."""
         if not self.memory._initialized:
             return "Meeting memory is not available."
         
-        return await self.memory.query_with_llm(question, self.summarizer)
+        return await self.memory.query_with_llm(
+            question, self.summarizer, force_refresh=force_refresh
+        )
 
     async def cleanup(self) -> None:
         """Cleanup resources."""
@@ -681,6 +782,9 @@ class SunnyAIController:
         if self.recorder.is_active:
             await self.recorder.end_session()
         
+        # Close the warm browser
+        await self.recorder.close()
+        
         # Close HTTP clients
         await self.summarizer.close()
         
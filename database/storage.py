@@ -7,7 +7,7 @@ import asyncio
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, AsyncIterator
 from dataclasses import dataclass, asdict
 import aiosqlite
 import structlog
@@ -15,7 +15,7 @@ import structlog
 logger = structlog.get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class MeetingRecord:
     """Database record for a meeting."""
     id: Optional[int] = None
@@ -33,6 +33,25 @@ class MeetingRecord:
     created_at: Optional[str] = None
 
 
+def _row_to_record(row: aiosqlite.Row) -> MeetingRecord:
+    """Convert a database row into a MeetingRecord."""
+    return MeetingRecord(
+        id=row['id'],
+        meeting_url=row['meeting_url'],
+        platform=row['platform'],
+        start_time=row['start_time'],
+        end_time=row['end_time'],
+        duration_seconds=row['duration_seconds'],
+        audio_file=row['audio_file'],
+        transcript=row['transcript'],
+        summary_json=row['summary_json'],
+        pdf_path=row['pdf_path'],
+        email_sent=bool(row['email_sent']),
+        email_recipient=row['email_recipient'],
+        created_at=row['created_at']
+    )
+
+
 class MeetingStorage:
     """SQLite storage for meeting data."""
 
@@ -162,25 +181,15 @@ class MeetingStorage:
             row = await cursor.fetchone()
             
             if row:
-                return MeetingRecord(
-                    id=row['id'],
-                    meeting_url=row['meeting_url'],
-                    platform=row['platform'],
-                    start_time=row['start_time'],
-                    end_time=row['end_time'],
-                    duration_seconds=row['duration_seconds'],
-                    audio_file=row['audio_file'],
-                    transcript=row['transcript'],
-                    summary_json=row['summary_json'],
-                    pdf_path=row['pdf_path'],
-                    email_sent=bool(row['email_sent']),
-                    email_recipient=row['email_recipient'],
-                    created_at=row['created_at']
-                )
+                return _row_to_record(row)
             return None
 
-    async def get_recent_meetings(self, limit: int = 10) -> List[MeetingRecord]:
-        """Get recent meetings."""
+    async def iter_recent_meetings(
+        self,
+        limit: int = 10,
+        batch_size: int = 64
+    ) -> AsyncIterator[MeetingRecord]:
+        """Iterate over recent meetings, fetching rows in batches."""
         await self.initialize()
         
         async with aiosqlite.connect(self.db_path) as db:
@@ -189,26 +198,17 @@ class MeetingStorage:
                 "SELECT * FROM meetings ORDER BY created_at DESC LIMIT ?",
                 (limit,)
             )
-            rows = await cursor.fetchall()
             
-            return [
-                MeetingRecord(
-                    id=row['id'],
-                    meeting_url=row['meeting_url'],
-                    platform=row['platform'],
-                    start_time=row['start_time'],
-                    end_time=row['end_time'],
-                    duration_seconds=row['duration_seconds'],
-                    audio_file=row['audio_file'],
-                    transcript=row['transcript'],
-                    summary_json=row['summary_json'],
-                    pdf_path=row['pdf_path'],
-                    email_sent=bool(row['email_sent']),
-                    email_recipient=row['email_recipient'],
-                    created_at=row['created_at']
-                )
-                for row in rows
-            ]
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    return
+                for row in rows:
+                    yield _row_to_record(row)
+
+    async def get_recent_meetings(self, limit: int = 10) -> List[MeetingRecord]:
+        """Get recent meetings."""
+        return [record async for record in self.iter_recent_meetings(limit)]
 
     async def delete_meeting(self, meeting_id: int) -> bool:
         """Delete a meeting record."""
@@ -4,8 +4,10 @@ Sends meeting summary PDFs via Gmail SMTP.
 """
 
 import os
+import asyncio
 import smtplib
 import ssl
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
@@ -44,6 +46,13 @@ class GmailSender:
             "subject_template", 
             "Meeting Summary - {date} - {platform}"
         )
+        self._format_subject = self.subject_template.format
+        
+        # Dedicated pool for MIME serialization and SMTP I/O
+        self._executor = ThreadPoolExecutor(
+            max_workers=email_config.get("max_workers", 4),
+            thread_name_prefix="gmail-sender"
+        )
         
         if not self.sender_email or not self.sender_password:
             logger.warning("Gmail credentials not configured. Email sending will fail.")
@@ -88,7 +97,7 @@ class GmailSender:
             msg = MIMEMultipart()
             msg['From'] = self.sender_email
             msg['To'] = recipient_email
-            msg['Subject'] = self.subject_template.format(
+            msg['Subject'] = self._format_subject(
                 date=meeting_date.strftime("%Y-%m-%d"),
                 platform=platform.replace('_', ' ').title()
             )
@@ -218,7 +227,10 @@ class GmailSender:
 
     async def _send_email(self, msg: MIMEMultipart, recipient: str) -> None:
         """Send email via SMTP."""
-        import asyncio
+        loop = asyncio.get_running_loop()
+        
+        # Serialize the MIME tree (including the base64 PDF) off the event loop
+        raw_message = await loop.run_in_executor(self._executor, msg.as_bytes)
         
         def _send():
             context = ssl.create_default_context()
@@ -228,10 +240,9 @@ class GmailSender:
                 server.starttls(context=context)
                 server.ehlo()
                 server.login(self.sender_email, self.sender_password)
-                server.sendmail(self.sender_email, recipient, msg.as_string())
+                server.sendmail(self.sender_email, recipient, raw_message)
         
-        loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, _send)
+        await loop.run_in_executor(self._executor, _send)
 
     async def send_batch(
         self,
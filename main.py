@@ -54,19 +54,18 @@ async def run_single_meeting(
         print("🤖 Sunny AI is joining the meeting...")
         print("\nPress Ctrl+C to stop the session manually.\n")
         
-        # Monitor session
-        last_status = None
-        while True:
-            await asyncio.sleep(5)
-            
-            status = await controller.get_session_status(session_id)
-            if status and status["status"] != last_status:
-                last_status = status["status"]
+        # Monitor session via status transitions pushed by the controller
+        status_queue = controller.subscribe_status(session_id)
+        try:
+            while True:
+                status = await status_queue.get()
                 _print_status_update(status)
-            
-            if status and status["status"] in ["completed", "error", "stopped"]:
-                break
-        
+
+                if status["status"] in ["completed", "error", "stopped"]:
+                    break
+        finally:
+            controller.unsubscribe_status(session_id, status_queue)
+
         # Print final results
         if status["status"] == "completed":
             _print_completion_summary(controller, session_id, status)
@@ -82,23 +81,24 @@ async def run_single_meeting(
         await controller.cleanup()
 
 
+STATUS_ICONS = {
+    "starting": "🔄",
+    "joining": "🚪",
+    "recording": "🎙️",
+    "processing": "⚙️",
+    "transcribing": "📝",
+    "summarizing": "🧠",
+    "generating_pdf": "📄",
+    "sending_email": "📧",
+    "completed": "✅",
+    "error": "❌",
+    "stopped": "⏹️"
+}
+
+
 def _print_status_update(status: dict) -> None:
     """Print status update."""
-    status_icons = {
-        "starting": "🔄",
-        "joining": "🚪",
-        "recording": "🎙️",
-        "processing": "⚙️",
-        "transcribing": "📝",
-        "summarizing": "🧠",
-        "generating_pdf": "📄",
-        "sending_email": "📧",
-        "completed": "✅",
-        "error": "❌",
-        "stopped": "⏹️"
-    }
-    
-    icon = status_icons.get(status["status"], "•")
+    icon = STATUS_ICONS.get(status["status"], "•")
     print(f"{icon} Status: {status['status'].replace('_', ' ').title()}")
 
 
@@ -148,6 +148,13 @@ async def run_api_server(config: dict, host: str = "0.0.0.0", port: int = 8000)
 
 def main():
     """Main entry point."""
+    # Use uvloop's faster event loop when available
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     parser = argparse.ArgumentParser(
         description="Sunny AI - Autonomous Meeting Attending & Summarization Agent",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -2,5 +2,6 @@
 from .joiner import MeetingJoiner
 from .audio import AudioCapture
 from .recorder import MeetingRecorder
+from .browser_pool import BrowserPool
 
-__all__ = ["MeetingJoiner", "AudioCapture", "MeetingRecorder"]
+__all__ = ["MeetingJoiner", "AudioCapture", "MeetingRecorder", "BrowserPool"]
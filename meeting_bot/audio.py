@@ -103,16 +103,8 @@ class AudioCapture:
             return None
 
         try:
-            # Concatenate all audio chunks
-            audio_array = np.concatenate(self._audio_data, axis=0)
-            
-            # Save to file
-            sf.write(
-                str(self._current_file),
-                audio_array,
-                self.sample_rate,
-                format=self.format.upper()
-            )
+            # Concatenate and save off the event loop so teardown can overlap
+            await asyncio.to_thread(self._write_audio_file)
             
             logger.info(f"Saved recording to {self._current_file}")
             return self._current_file
@@ -121,6 +113,16 @@ class AudioCapture:
             logger.error(f"Failed to save audio: {e}")
             return None
 
+    def _write_audio_file(self) -> None:
+        """Concatenate captured chunks and write them to the current file."""
+        audio_array = np.concatenate(self._audio_data, axis=0)
+        sf.write(
+            str(self._current_file),
+            audio_array,
+            self.sample_rate,
+            format=self.format.upper()
+        )
+
     @property
     def is_recording(self) -> bool:
         """Check if currently recording."""
@@ -133,12 +135,16 @@ class AudioCapture:
 
         audio_array = np.concatenate(self._audio_data, axis=0)
         chunk_samples = self.chunk_duration * self.sample_rate
-        
-        chunks = []
-        for i in range(0, len(audio_array), chunk_samples):
-            chunk = audio_array[i:i + chunk_samples]
-            chunks.append(chunk)
-        
+
+        # Reshape full chunks as views of the buffer instead of slicing in a loop
+        n_full, remainder = divmod(len(audio_array), chunk_samples)
+        split_at = n_full * chunk_samples
+        chunks = list(
+            audio_array[:split_at].reshape(n_full, chunk_samples, *audio_array.shape[1:])
+        )
+        if remainder:
+            chunks.append(audio_array[split_at:])
+
         return chunks
 
     def get_duration_seconds(self) -> float:
@@ -0,0 +1,135 @@
+"""
+Browser Pool Module
+Keeps a warm Chromium instance shared across meeting sessions.
+"""
+
+import asyncio
+from typing import Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Chromium flags: media permissions for joining, plus switches that turn off
+# subsystems the bot never needs (images, GPU, extensions, background throttling)
+CHROMIUM_ARGS = [
+    "--use-fake-ui-for-media-stream",
+    "--use-fake-device-for-media-stream",
+    "--disable-web-security",
+    "--allow-running-insecure-content",
+    "--autoplay-policy=no-user-gesture-required",
+    "--blink-settings=imagesEnabled=false",
+    "--disable-gpu",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+    "--disable-ipc-flooding-protection",
+    "--no-sandbox",
+]
+
+
+class BrowserPool:
+    """Shares one lazily launched browser and hands out a context per meeting."""
+
+    def __init__(self, config: dict):
+        browser_config = config.get("browser", {})
+        self.headless = browser_config.get("headless", True)
+        self.launch_args = CHROMIUM_ARGS + browser_config.get("extra_args", [])
+        self.idle_ttl = browser_config.get("pool_idle_ttl_seconds", 600)
+        self.max_sessions = browser_config.get("pool_max_sessions", 20)
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._lock = asyncio.Lock()
+        self._active_contexts = 0
+        self._sessions_served = 0
+        self._idle_task: Optional[asyncio.Task] = None
+
+    async def warm_up(self) -> None:
+        """Launch the browser ahead of the first session."""
+        async with self._lock:
+            await self._ensure_browser()
+            if self._active_contexts == 0:
+                self._cancel_idle_timer()
+                self._start_idle_timer()
+
+    async def acquire_context(self, **context_options) -> BrowserContext:
+        """Create a fresh context on the warm browser, launching it if needed."""
+        async with self._lock:
+            self._cancel_idle_timer()
+            browser = await self._ensure_browser()
+            context = await browser.new_context(**context_options)
+            self._active_contexts += 1
+            return context
+
+    async def release_context(self, context: BrowserContext) -> None:
+        """Close a context and return its slot to the pool."""
+        try:
+            await context.close()
+        except Exception as e:
+            logger.warning(f"Error closing browser context: {e}")
+
+        async with self._lock:
+            self._active_contexts = max(0, self._active_contexts - 1)
+            self._sessions_served += 1
+
+            if self._active_contexts == 0:
+                if self._sessions_served >= self.max_sessions:
+                    # Recycle the browser to bound memory growth
+                    logger.info("Recycling browser after max sessions")
+                    await self._close_browser()
+                else:
+                    self._start_idle_timer()
+
+    async def close(self) -> None:
+        """Close the browser and stop Playwright."""
+        async with self._lock:
+            self._cancel_idle_timer()
+            await self._close_browser()
+
+    async def _ensure_browser(self) -> Browser:
+        """Return the running browser, launching it on first use."""
+        if self._browser and self._browser.is_connected():
+            return self._browser
+
+        if self._playwright is None:
+            self._playwright = await async_playwright().start()
+
+        self._browser = await self._playwright.chromium.launch(
+            headless=self.headless,
+            args=self.launch_args
+        )
+        self._sessions_served = 0
+        logger.info("Browser launched")
+        return self._browser
+
+    async def _close_browser(self) -> None:
+        """Shut down the browser and Playwright driver."""
+        if self._browser:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser closed")
+
+    def _start_idle_timer(self) -> None:
+        """Schedule the browser to close after the idle TTL."""
+        if self.idle_ttl > 0:
+            self._idle_task = asyncio.create_task(self._close_when_idle())
+
+    def _cancel_idle_timer(self) -> None:
+        """Cancel a pending idle shutdown."""
+        if self._idle_task and not self._idle_task.done():
+            self._idle_task.cancel()
+        self._idle_task = None
+
+    async def _close_when_idle(self) -> None:
+        """Close the browser if no context was acquired during the TTL."""
+        await asyncio.sleep(self.idle_ttl)
+        async with self._lock:
+            if self._active_contexts == 0:
+                logger.info("Closing idle browser")
+                await self._close_browser()
@@ -4,15 +4,142 @@ Handles automatic joining of Zoom and Google Meet meetings.
 """
 
 import asyncio
+import json
 import re
 from enum import Enum
 from typing import Optional, Callable
 from dataclasses import dataclass
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
+from playwright.async_api import Page, BrowserContext, CDPSession, Route
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import structlog
 
+from .browser_pool import BrowserPool
+
 logger = structlog.get_logger(__name__)
 
+# URL patterns used to detect the platform and parse meeting details
+_PLATFORM_HOST = re.compile(r'zoom\.us|zoom\.com|meet\.google\.com', re.IGNORECASE)
+_ZOOM_ID = re.compile(r'/j/(\d+)')
+_ZOOM_PWD = re.compile(r'pwd=([^&]+)')
+_MEET_CODE = re.compile(r'meet\.google\.com/([a-z]{3}-[a-z]{4}-[a-z]{3})')
+
+# First interactive elements of each join screen; navigation waits on these
+# instead of network idle, which never settles on streaming meeting pages.
+MEET_READY_SELECTOR = (
+    'input[aria-label="Your name"], input[placeholder="Your name"], '
+    'button:has-text("Join now"), button:has-text("Ask to join")'
+)
+ZOOM_READY_SELECTOR = '#inputname, a:has-text("Join from Your Browser")'
+
+# Poll interval for in-page state checks; wait_for_function accepts only
+# milliseconds or "raf", and animation frames are throttled in hidden tabs
+STATE_POLL_INTERVAL_MS = 250
+
+# Resource types the bot never needs to join or monitor a meeting
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+
+HIDE_WEBDRIVER_SCRIPT = "Object.defineProperty(navigator, 'webdriver', {get: () => false})"
+
+# Page text that signals the meeting is over (matched case-insensitively)
+END_INDICATORS = [
+    "you left the meeting",
+    "meeting has ended",
+    "call ended",
+    "the meeting has been ended",
+    "host has ended the meeting"
+]
+
+# CDP binding the page calls to push the meeting-ended event to Python
+MEETING_ENDED_BINDING = "__sunnyMeetingEnded"
+
+# Installed on every page: watches DOM mutations (checked at most once a
+# second) and latches window.__meetingEnded once an end indicator appears,
+# then notifies Python through the CDP binding.
+MEETING_END_OBSERVER_SCRIPT = """
+(() => {
+    const endPattern = new RegExp(%s, "i");
+    let scheduled = false;
+    const check = () => {
+        scheduled = false;
+        if (window.__meetingEnded) return;
+        if (document.querySelector('[data-call-ended="true"]') ||
+                endPattern.test(document.body ? document.body.innerText : "")) {
+            window.__meetingEnded = true;
+            observer.disconnect();
+            if (typeof window.%s === "function") window.%s("ended");
+        }
+    };
+    const observer = new MutationObserver(() => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(check, 1000);
+        }
+    });
+    observer.observe(document, {
+        subtree: true,
+        childList: true,
+        characterData: true,
+        attributes: true,
+        attributeFilter: ["data-call-ended"]
+    });
+})();
+""" % (
+    json.dumps("|".join(re.escape(indicator) for indicator in END_INDICATORS)),
+    MEETING_ENDED_BINDING,
+    MEETING_ENDED_BINDING
+)
+
+MEETING_ENDED_SCRIPT = "() => window.__meetingEnded === true"
+
+# Locators are (CSS selector, lowercase text or None) pairs checked in order.
+# Text replaces Playwright's :has-text(), which querySelector does not support.
+IN_MEETING_LOCATORS = [
+    # Google Meet
+    ['[data-meeting-title]', None],
+    ['[data-self-name]', None],
+    ['.google-material-icons', 'call_end'],
+    # Zoom
+    ['#wc-container-left', None],
+    ['.meeting-client', None],
+    ['[aria-label="Leave meeting"]', None],
+]
+
+LEAVE_LOCATORS = [
+    ['[aria-label="Leave call"]', None],
+    ['button', 'leave'],
+    ['[aria-label="Leave meeting"]', None],
+    ['.google-material-icons', 'call_end'],
+]
+
+FIND_FIRST_SCRIPT = """
+([locators, click]) => {
+    for (const [selector, text] of locators) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (text === null || el.textContent.toLowerCase().includes(text)) {
+                if (click) el.click();
+                return true;
+            }
+        }
+    }
+    return false;
+}
+"""
+
+ADMISSION_STATE_SCRIPT = """
+(locators) => {
+    for (const [selector, text] of locators) {
+        for (const el of document.querySelectorAll(selector)) {
+            if (text === null || el.textContent.toLowerCase().includes(text)) {
+                return "admitted";
+            }
+        }
+    }
+    const pageText = document.body ? document.body.innerText : "";
+    return /denied|removed/i.test(pageText) ? "denied" : null;
+}
+"""
+
 
 class MeetingPlatform(Enum):
     ZOOM = "zoom"
@@ -20,7 +147,14 @@ class MeetingPlatform(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+_PLATFORM_BY_HOST = {
+    "zoom.us": MeetingPlatform.ZOOM,
+    "zoom.com": MeetingPlatform.ZOOM,
+    "meet.google.com": MeetingPlatform.GOOGLE_MEET,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class MeetingInfo:
     platform: MeetingPlatform
     meeting_id: str
@@ -31,26 +165,29 @@ class MeetingInfo:
 class MeetingJoiner:
     """Autonomous meeting joiner for Zoom and Google Meet."""
 
-    def __init__(self, config: dict):
+    def __init__(self, config: dict, browser_pool: Optional[BrowserPool] = None):
         self.config = config
         self.bot_name = config.get("general", {}).get("bot_name", "Sunny AI – Assistant")
-        self.browser: Optional[Browser] = None
+        self.browser_pool = browser_pool or BrowserPool(config)
+        
+        meeting_config = config.get("meeting", {})
+        self.selector_timeout_ms = meeting_config.get("selector_timeout_ms", 3000)
+        self.optional_selector_timeout_ms = meeting_config.get("optional_selector_timeout_ms", 800)
+        self.navigation_timeout_ms = meeting_config.get("navigation_timeout_ms", 15000)
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.cdp_session: Optional[CDPSession] = None
+        self.meeting_ended = asyncio.Event()
         self.is_in_meeting = False
         self._meeting_end_callback: Optional[Callable] = None
-        self._playwright = None
 
     def detect_platform(self, url: str) -> MeetingPlatform:
         """Detect meeting platform from URL."""
-        url_lower = url.lower()
-        
-        if "zoom.us" in url_lower or "zoom.com" in url_lower:
-            return MeetingPlatform.ZOOM
-        elif "meet.google.com" in url_lower:
-            return MeetingPlatform.GOOGLE_MEET
-        else:
+        match = _PLATFORM_HOST.search(url)
+        if not match:
             return MeetingPlatform.UNKNOWN
+        # Only the short matched host is lowercased, never the whole URL
+        return _PLATFORM_BY_HOST[match.group(0).lower()]
 
     def parse_meeting_url(self, url: str) -> MeetingInfo:
         """Parse meeting URL and extract relevant information."""
@@ -60,17 +197,17 @@ class MeetingJoiner:
 
         if platform == MeetingPlatform.ZOOM:
             # Extract Zoom meeting ID
-            match = re.search(r'/j/(\d+)', url)
+            match = _ZOOM_ID.search(url)
             if match:
                 meeting_id = match.group(1)
             # Extract password if present
-            pwd_match = re.search(r'pwd=([^&]+)', url)
+            pwd_match = _ZOOM_PWD.search(url)
             if pwd_match:
                 password = pwd_match.group(1)
 
         elif platform == MeetingPlatform.GOOGLE_MEET:
             # Extract Google Meet code
-            match = re.search(r'meet\.google\.com/([a-z]{3}-[a-z]{4}-[a-z]{3})', url)
+            match = _MEET_CODE.search(url)
             if match:
                 meeting_id = match.group(1)
 
@@ -82,37 +219,56 @@ class MeetingJoiner:
         )
 
     async def initialize_browser(self) -> None:
-        """Initialize Playwright browser."""
+        """Acquire a browser context and page from the warm browser pool."""
         browser_config = self.config.get("browser", {})
         
-        self._playwright = await async_playwright().start()
-        
-        self.browser = await self._playwright.chromium.launch(
-            headless=browser_config.get("headless", False),
-            args=[
-                "--use-fake-ui-for-media-stream",
-                "--use-fake-device-for-media-stream",
-                "--disable-web-security",
-                "--allow-running-insecure-content",
-                "--autoplay-policy=no-user-gesture-required",
-            ]
-        )
-        
-        self.context = await self.browser.new_context(
-            permissions=["microphone", "camera"],
+        self.context = await self.browser_pool.acquire_context(
             user_agent=browser_config.get("user_agent"),
-            viewport={"width": 1280, "height": 720}
+            viewport=browser_config.get("viewport", {"width": 1024, "height": 600})
         )
         
         self.page = await self.context.new_page()
+        self.page.set_default_timeout(self.selector_timeout_ms)
+        self.page.set_default_navigation_timeout(self.navigation_timeout_ms)
+        
+        # Meeting end is pushed from the page over CDP rather than polled
+        self.meeting_ended.clear()
+        self.cdp_session = await self.context.new_cdp_session(self.page)
+        self.cdp_session.on("Runtime.bindingCalled", self._on_binding_called)
+        
+        # Remaining setup steps are independent round-trips
+        setup_steps = [
+            self.context.grant_permissions(["microphone", "camera"]),
+            self.cdp_session.send("Runtime.addBinding", {"name": MEETING_ENDED_BINDING}),
+            self.context.add_init_script(MEETING_END_OBSERVER_SCRIPT),
+            self.page.add_init_script(HIDE_WEBDRIVER_SCRIPT)
+        ]
+        if browser_config.get("block_resources", True):
+            setup_steps.append(self.context.route("**/*", self._block_heavy_resources))
+        await asyncio.gather(*setup_steps)
         logger.info("Browser initialized successfully")
 
+    async def _block_heavy_resources(self, route: Route) -> None:
+        """Abort image, media and font requests; let everything else through."""
+        if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def _on_binding_called(self, params: dict) -> None:
+        """Handle CDP binding calls made by the in-page observer."""
+        if params.get("name") == MEETING_ENDED_BINDING:
+            self.meeting_ended.set()
+
     async def join_meeting(self, url: str) -> bool:
         """Join a meeting from the given URL."""
-        meeting_info = self.parse_meeting_url(url)
+        return await self.join_meeting_info(self.parse_meeting_url(url))
+
+    async def join_meeting_info(self, meeting_info: MeetingInfo) -> bool:
+        """Join a meeting from already parsed meeting info."""
         logger.info(f"Joining {meeting_info.platform.value} meeting", meeting_id=meeting_info.meeting_id)
 
-        if not self.browser:
+        if not self.context:
             await self.initialize_browser()
 
         try:
@@ -128,56 +284,31 @@ class MeetingJoiner:
             return False
 
 
-    async def _join_google_meet(self, meeting_info: MeetingInfo) -> bool:
-        """Join a Google Meet meeting."""
+    async def _navigate(self, url: str, ready_selector: str) -> None:
+        """Navigate to a join page and wait for its first interactive element."""
         try:
-            await self.page.goto(meeting_info.url, wait_until="networkidle")
-            await asyncio.sleep(2)
-
-            # Handle "Got it" or cookie consent buttons
-            try:
-                got_it_btn = await self.page.query_selector('button:has-text("Got it")')
-                if got_it_btn:
-                    await got_it_btn.click()
-                    await asyncio.sleep(1)
-            except Exception:
-                pass
+            await self.page.goto(url, wait_until="domcontentloaded")
+        except PlaywrightTimeoutError:
+            logger.warning("Navigation timed out, waiting for join UI anyway")
 
-            # Enter name
-            try:
-                name_input = await self.page.wait_for_selector(
-                    'input[placeholder="Your name"], input[aria-label="Your name"]',
-                    timeout=10000
-                )
-                if name_input:
-                    await name_input.fill(self.bot_name)
-                    logger.info(f"Entered name: {self.bot_name}")
-            except Exception as e:
-                logger.warning(f"Could not find name input: {e}")
-
-            # Turn off camera
-            try:
-                camera_btn = await self.page.query_selector(
-                    '[aria-label*="camera"], [data-is-muted="false"][aria-label*="video"]'
-                )
-                if camera_btn:
-                    await camera_btn.click()
-                    await asyncio.sleep(0.5)
-                    logger.info("Camera turned off")
-            except Exception:
-                pass
+        try:
+            await self.page.wait_for_selector(ready_selector, timeout=self.navigation_timeout_ms)
+        except PlaywrightTimeoutError:
+            logger.warning("Join UI did not appear before timeout")
 
-            # Turn off microphone
-            try:
-                mic_btn = await self.page.query_selector(
-                    '[aria-label*="microphone"], [data-is-muted="false"][aria-label*="mic"]'
-                )
-                if mic_btn:
-                    await mic_btn.click()
-                    await asyncio.sleep(0.5)
-                    logger.info("Microphone muted")
-            except Exception:
-                pass
+    async def _join_google_meet(self, meeting_info: MeetingInfo) -> bool:
+        """Join a Google Meet meeting."""
+        try:
+            await self._navigate(meeting_info.url, MEET_READY_SELECTOR)
+
+            # Pre-join UI steps are independent, so run them concurrently
+            await asyncio.gather(
+                self._dismiss_got_it(),
+                self._fill_meet_name(),
+                self._turn_off_camera(),
+                self._turn_off_mic(),
+                return_exceptions=True
+            )
 
             # Click "Ask to join" or "Join now" button
             join_selectors = [
@@ -187,21 +318,10 @@ class MeetingJoiner:
                 '[data-idom-class*="join"]'
             ]
 
-            for selector in join_selectors:
-                try:
-                    join_btn = await self.page.wait_for_selector(selector, timeout=5000)
-                    if join_btn:
-                        await join_btn.click()
-                        logger.info("Clicked join button")
-                        break
-                except Exception:
-                    continue
+            await self._click_join_button(join_selectors)
 
-            # Wait for meeting to load
-            await asyncio.sleep(5)
-
-            # Check if we're in the meeting
-            self.is_in_meeting = await self._verify_in_meeting()
+            # Wait for the meeting UI to load, or fall through to the waiting room
+            self.is_in_meeting = await self._wait_for_meeting_ui()
             
             if self.is_in_meeting:
                 logger.info("Successfully joined Google Meet")
@@ -215,6 +335,62 @@ class MeetingJoiner:
             logger.error(f"Failed to join Google Meet: {e}")
             return False
 
+    async def _click_join_button(self, selectors: list) -> None:
+        """Wait once for any of the join button selectors and click it."""
+        try:
+            join_btn = await self.page.wait_for_selector(", ".join(selectors))
+            if join_btn:
+                await join_btn.click()
+                logger.info("Clicked join button")
+        except Exception as e:
+            logger.warning(f"Could not click join button: {e}")
+
+    async def _dismiss_got_it(self) -> None:
+        """Dismiss the "Got it" or cookie consent button if shown."""
+        try:
+            got_it_btn = await self.page.query_selector('button:has-text("Got it")')
+            if got_it_btn:
+                await got_it_btn.click()
+        except Exception:
+            pass
+
+    async def _fill_meet_name(self) -> None:
+        """Enter the bot name on the Meet pre-join screen."""
+        try:
+            name_input = await self.page.wait_for_selector(
+                'input[placeholder="Your name"], input[aria-label="Your name"]',
+                state="visible"
+            )
+            if name_input:
+                await name_input.fill(self.bot_name)
+                logger.info(f"Entered name: {self.bot_name}")
+        except Exception as e:
+            logger.warning(f"Could not find name input: {e}")
+
+    async def _turn_off_camera(self) -> None:
+        """Turn off the camera on the Meet pre-join screen."""
+        try:
+            camera_btn = await self.page.query_selector(
+                '[aria-label*="camera"], [data-is-muted="false"][aria-label*="video"]'
+            )
+            if camera_btn:
+                await camera_btn.click()
+                logger.info("Camera turned off")
+        except Exception:
+            pass
+
+    async def _turn_off_mic(self) -> None:
+        """Mute the microphone on the Meet pre-join screen."""
+        try:
+            mic_btn = await self.page.query_selector(
+                '[aria-label*="microphone"], [data-is-muted="false"][aria-label*="mic"]'
+            )
+            if mic_btn:
+                await mic_btn.click()
+                logger.info("Microphone muted")
+        except Exception:
+            pass
+
     async def _join_zoom(self, meeting_info: MeetingInfo) -> bool:
         """Join a Zoom meeting via web client."""
         try:
@@ -223,26 +399,23 @@ class MeetingJoiner:
             if "/j/" in web_url:
                 web_url = web_url.replace("/j/", "/wc/join/")
             
-            await self.page.goto(web_url, wait_until="networkidle")
-            await asyncio.sleep(3)
+            await self._navigate(web_url, ZOOM_READY_SELECTOR)
 
             # Click "Join from Your Browser" if available
             try:
                 browser_join = await self.page.wait_for_selector(
                     'a:has-text("Join from Your Browser"), a:has-text("join from your browser")',
-                    timeout=10000
+                    timeout=self.optional_selector_timeout_ms
                 )
                 if browser_join:
                     await browser_join.click()
-                    await asyncio.sleep(3)
             except Exception:
                 pass
 
             # Enter name
             try:
                 name_input = await self.page.wait_for_selector(
-                    '#inputname, input[placeholder*="name"], input[id*="name"]',
-                    timeout=10000
+                    '#inputname, input[placeholder*="name"], input[id*="name"]'
                 )
                 if name_input:
                     await name_input.fill(self.bot_name)
@@ -269,23 +442,16 @@ class MeetingJoiner:
                 'button[type="submit"]'
             ]
 
-            for selector in join_selectors:
-                try:
-                    join_btn = await self.page.wait_for_selector(selector, timeout=5000)
-                    if join_btn:
-                        await join_btn.click()
-                        logger.info("Clicked join button")
-                        break
-                except Exception:
-                    continue
+            await self._click_join_button(join_selectors)
 
-            await asyncio.sleep(5)
+            # Wait for the meeting UI to load before handling the AV popup
+            self.is_in_meeting = await self._wait_for_meeting_ui()
 
             # Handle audio/video permissions
             await self._handle_zoom_av_settings()
 
-            # Verify we're in the meeting
-            self.is_in_meeting = await self._verify_in_meeting()
+            if not self.is_in_meeting:
+                self.is_in_meeting = await self._verify_in_meeting()
             
             if self.is_in_meeting:
                 logger.info("Successfully joined Zoom meeting")
@@ -301,85 +467,87 @@ class MeetingJoiner:
     async def _handle_zoom_av_settings(self) -> None:
         """Handle Zoom audio/video settings popup."""
         try:
-            # Join with computer audio
+            # Join with computer audio; the mute control only applies once audio is joined
             audio_btn = await self.page.query_selector(
                 'button:has-text("Join Audio by Computer"), button:has-text("Join with Computer Audio")'
             )
             if audio_btn:
                 await audio_btn.click()
-                await asyncio.sleep(1)
-
-            # Mute microphone
-            mute_btn = await self.page.query_selector(
-                '[aria-label*="mute"], button:has-text("Mute")'
-            )
-            if mute_btn:
-                await mute_btn.click()
 
-            # Stop video
-            video_btn = await self.page.query_selector(
-                '[aria-label*="stop video"], button:has-text("Stop Video")'
+            # Mute microphone and stop video concurrently; after joining audio the
+            # mute control renders a moment later, so wait for it rather than probe once
+            mute_selector = '[aria-label*="mute"], button:has-text("Mute")'
+            await asyncio.gather(
+                self._click_when_present(mute_selector, self.selector_timeout_ms)
+                if audio_btn else self._click_if_present(mute_selector),
+                self._click_if_present('[aria-label*="stop video"], button:has-text("Stop Video")')
             )
-            if video_btn:
-                await video_btn.click()
 
         except Exception as e:
             logger.warning(f"Error handling AV settings: {e}")
 
+    async def _click_if_present(self, selector: str) -> None:
+        """Click the first element matching selector, if any."""
+        element = await self.page.query_selector(selector)
+        if element:
+            await element.click()
+
+    async def _click_when_present(self, selector: str, timeout_ms: int) -> None:
+        """Click the first element matching selector once it appears, up to timeout_ms."""
+        try:
+            element = await self.page.wait_for_selector(selector, timeout=timeout_ms)
+        except PlaywrightTimeoutError:
+            return
+        if element:
+            await element.click()
+
     async def _verify_in_meeting(self) -> bool:
         """Verify that we're actually in the meeting."""
         try:
-            # Google Meet indicators
-            meet_indicators = [
-                '[data-meeting-title]',
-                '[data-self-name]',
-                '.google-material-icons:has-text("call_end")'
-            ]
-            
-            # Zoom indicators
-            zoom_indicators = [
-                '#wc-container-left',
-                '.meeting-client',
-                '[aria-label="Leave meeting"]'
-            ]
-
-            all_indicators = meet_indicators + zoom_indicators
-            
-            for indicator in all_indicators:
-                try:
-                    element = await self.page.query_selector(indicator)
-                    if element:
-                        return True
-                except Exception:
-                    continue
-
-            return False
-            
+            # One round-trip checks every Meet and Zoom indicator
+            return await self.page.evaluate(FIND_FIRST_SCRIPT, [IN_MEETING_LOCATORS, False])
         except Exception:
             return False
 
+    async def _wait_for_meeting_ui(self) -> bool:
+        """Wait briefly for in-meeting indicators after clicking join."""
+        try:
+            await self.page.wait_for_function(
+                FIND_FIRST_SCRIPT,
+                arg=[IN_MEETING_LOCATORS, False],
+                polling=STATE_POLL_INTERVAL_MS,
+                timeout=self.selector_timeout_ms
+            )
+            return True
+        except PlaywrightTimeoutError:
+            return False
+
     async def _wait_for_admission(self) -> bool:
         """Wait for host to admit from waiting room."""
         timeout = self.config.get("meeting", {}).get("waiting_room_timeout_seconds", 300)
-        check_interval = 5
-        elapsed = 0
-
-        while elapsed < timeout:
-            await asyncio.sleep(check_interval)
-            elapsed += check_interval
 
-            if await self._verify_in_meeting():
-                logger.info("Admitted to meeting")
-                self.is_in_meeting = True
-                return True
+        try:
+            # Resolves on the first poll that finds us admitted or denied
+            handle = await self.page.wait_for_function(
+                ADMISSION_STATE_SCRIPT,
+                arg=IN_MEETING_LOCATORS,
+                polling=STATE_POLL_INTERVAL_MS,
+                timeout=timeout * 1000
+            )
+            state = await handle.json_value()
+        except PlaywrightTimeoutError:
+            logger.warning("Waiting room timeout exceeded")
+            return False
+        except PlaywrightError as e:
+            logger.error(f"Error while waiting for admission: {e}")
+            return False
 
-            # Check if denied
-            page_content = await self.page.content()
-            if "denied" in page_content.lower() or "removed" in page_content.lower():
-                logger.warning("Entry was denied")
-                return False
+        if state == "admitted":
+            logger.info("Admitted to meeting")
+            self.is_in_meeting = True
+            return True
 
-        logger.warning("Waiting room timeout exceeded")
+        logger.warning("Entry was denied")
         return False
 
     async def leave_meeting(self) -> None:
@@ -388,34 +556,20 @@ class MeetingJoiner:
         
         if self.page:
             try:
-                # Try to click leave button
-                leave_selectors = [
-                    '[aria-label="Leave call"]',
-                    'button:has-text("Leave")',
-                    '[aria-label="Leave meeting"]',
-                    '.google-material-icons:has-text("call_end")'
-                ]
-                
-                for selector in leave_selectors:
-                    try:
-                        leave_btn = await self.page.query_selector(selector)
-                        if leave_btn:
-                            await leave_btn.click()
-                            await asyncio.sleep(1)
-                            break
-                    except Exception:
-                        continue
+                # Click the first leave button found, in a single round-trip
+                clicked = await self.page.evaluate(FIND_FIRST_SCRIPT, [LEAVE_LOCATORS, True])
+                if clicked:
+                    await asyncio.sleep(1)
                         
             except Exception as e:
                 logger.warning(f"Error clicking leave button: {e}")
 
-        # Close browser
+        # Return the context to the pool; the browser stays warm for the next session
         if self.context:
-            await self.context.close()
-        if self.browser:
-            await self.browser.close()
-        if self._playwright:
-            await self._playwright.stop()
+            await self.browser_pool.release_context(self.context)
+        self.context = None
+        self.page = None
+        self.cdp_session = None
 
         self.is_in_meeting = False
-        logger.info("Left meeting and closed browser")
+        logger.info("Left meeting and released browser context")
@@ -11,12 +11,12 @@ from datetime import datetime
 from enum import Enum
 import structlog
 
-from .joiner import MeetingJoiner, MeetingPlatform
+from .joiner import MeetingJoiner, MeetingPlatform, MEETING_ENDED_SCRIPT
 from .audio import AudioCapture
+from .browser_pool import BrowserPool
 
 logger = structlog.get_logger(__name__)
 
-
 class RecordingState(Enum):
     IDLE = "idle"
     JOINING = "joining"
@@ -26,7 +26,7 @@ class RecordingState(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(slots=True)
 class MeetingSession:
     meeting_url: str
     platform: MeetingPlatform
@@ -43,7 +43,8 @@ class MeetingRecorder:
 
     def __init__(self, config: dict):
         self.config = config
-        self.joiner = MeetingJoiner(config)
+        self.browser_pool = BrowserPool(config)
+        self.joiner = MeetingJoiner(config, self.browser_pool)
         self.audio_capture = AudioCapture(config)
         self.session: Optional[MeetingSession] = None
         self._monitoring_task: Optional[asyncio.Task] = None
@@ -59,19 +60,19 @@ class MeetingRecorder:
 
     async def start_session(self, meeting_url: str) -> MeetingSession:
         """Start a new meeting session."""
-        platform = self.joiner.detect_platform(meeting_url)
+        meeting_info = self.joiner.parse_meeting_url(meeting_url)
         
         self.session = MeetingSession(
             meeting_url=meeting_url,
-            platform=platform,
+            platform=meeting_info.platform,
             state=RecordingState.JOINING
         )
         
-        logger.info(f"Starting session for {platform.value} meeting")
+        logger.info(f"Starting session for {meeting_info.platform.value} meeting")
 
         try:
             # Join the meeting
-            joined = await self.joiner.join_meeting(meeting_url)
+            joined = await self.joiner.join_meeting_info(meeting_info)
             
             if not joined:
                 self.session.state = RecordingState.ERROR
@@ -100,28 +101,32 @@ class MeetingRecorder:
 
     async def _monitor_meeting(self) -> None:
         """Monitor meeting status and detect when it ends."""
-        start_time = datetime.now()
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_duration
         
         while self.session and self.session.state == RecordingState.RECORDING:
-            await asyncio.sleep(self.end_detection_interval)
-            
-            # Check max duration
-            elapsed = (datetime.now() - start_time).total_seconds()
-            if elapsed >= self.max_duration:
+            # Check max duration against the loop's monotonic clock
+            remaining = deadline - loop.time()
+            if remaining <= 0:
                 logger.info("Max meeting duration reached")
                 await self.end_session()
                 break
             
-            # Check if meeting has ended (browser-based detection)
-            if self.joiner.page:
-                try:
-                    meeting_ended = await self._check_meeting_ended()
-                    if meeting_ended:
-                        logger.info("Meeting end detected")
-                        await self.end_session()
-                        break
-                except Exception as e:
-                    logger.warning(f"Error checking meeting status: {e}")
+            try:
+                # The page pushes a CDP binding call the moment the meeting ends
+                await asyncio.wait_for(
+                    self.joiner.meeting_ended.wait(),
+                    timeout=min(self.end_detection_interval, remaining)
+                )
+                meeting_ended = True
+            except asyncio.TimeoutError:
+                # Safety net in case the page flagged the end before the binding was attached
+                meeting_ended = bool(self.joiner.page) and await self._check_meeting_ended()
+            
+            if meeting_ended:
+                logger.info("Meeting end detected")
+                await self.end_session()
+                break
 
     async def _check_meeting_ended(self) -> bool:
         """Check if the meeting has ended based on page content."""
@@ -129,27 +134,8 @@ class MeetingRecorder:
             return True
 
         try:
-            # Google Meet end indicators
-            meet_ended = await self.joiner.page.query_selector('[data-call-ended="true"]')
-            if meet_ended:
-                return True
-
-            # Check for "You left the meeting" or similar text
-            page_content = await self.joiner.page.content()
-            end_indicators = [
-                "you left the meeting",
-                "meeting has ended",
-                "call ended",
-                "the meeting has been ended",
-                "host has ended the meeting"
-            ]
-            
-            for indicator in end_indicators:
-                if indicator in page_content.lower():
-                    return True
-
-            return False
-            
+            # The in-page observer does the detection; this is a single flag read
+            return await self.joiner.page.evaluate(MEETING_ENDED_SCRIPT)
         except Exception:
             return False
 
@@ -161,20 +147,22 @@ class MeetingRecorder:
 
         logger.info("Ending meeting session")
         
-        # Cancel monitoring task
-        if self._monitoring_task:
+        # Cancel monitoring task (unless it is the one ending the session)
+        if self._monitoring_task and self._monitoring_task is not asyncio.current_task():
             self._monitoring_task.cancel()
             try:
                 await self._monitoring_task
             except asyncio.CancelledError:
                 pass
 
-        # Stop audio recording
+        # Stop audio recording and leave the meeting concurrently; both always run
+        teardown = [self.joiner.leave_meeting()]
         if self.audio_capture.is_recording:
-            await self.audio_capture.stop_recording()
-
-        # Leave meeting and close browser
-        await self.joiner.leave_meeting()
+            teardown.append(self.audio_capture.stop_recording())
+        
+        for result in await asyncio.gather(*teardown, return_exceptions=True):
+            if isinstance(result, Exception):
+                logger.warning(f"Error during session teardown: {result}")
 
         # Update session
         self.session.end_time = datetime.now()
@@ -195,16 +183,25 @@ class MeetingRecorder:
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in human-readable format."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
+        minutes, secs = divmod(int(seconds), 60)
+        hours, minutes = divmod(minutes, 60)
         
-        if hours > 0:
+        if hours:
             return f"{hours}h {minutes}m {secs}s"
-        elif minutes > 0:
+        if minutes:
             return f"{minutes}m {secs}s"
-        else:
-            return f"{secs}s"
+        return f"{secs}s"
+
+    async def warm_up(self) -> None:
+        """Start the shared browser before the first session needs it."""
+        try:
+            await self.browser_pool.warm_up()
+        except Exception as e:
+            logger.warning(f"Browser warm-up failed: {e}")
+
+    async def close(self) -> None:
+        """Shut down the shared browser."""
+        await self.browser_pool.close()
 
     @property
     def is_active(self) -> bool:
@@ -3,16 +3,23 @@ PDF Generator Module
 Creates professional meeting summary reports.
 """
 
+import asyncio
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, List
+from xml.sax.saxutils import escape  # Model and transcript text is plain text, not Paragraph markup
+from reportlab import rl_config
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, HRFlowable
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, LongTable,
+    TableStyle, PageBreak, HRFlowable
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
 import structlog
@@ -21,17 +28,206 @@ from summarization.llm_pipeline import MeetingSummary
 
 logger = structlog.get_logger(__name__)
 
+# Rows per action item sub-table; keeps reportlab's table layout cost linear
+ACTION_TABLE_ROWS_PER_CHUNK = 50
+
+# Report colours, parsed once at import
+PALETTE = {
+    'title': colors.HexColor('#1a365d'),
+    'heading': colors.HexColor('#2d3748'),
+    'text_muted': colors.HexColor('#4a5568'),
+    'text_subtle': colors.HexColor('#718096'),
+    'rule': colors.HexColor('#e2e8f0'),
+    'row_alt': colors.HexColor('#f7fafc'),
+    'analytics_header': colors.HexColor('#f59e0b'),
+    'analytics_row_alt': colors.HexColor('#fffbeb'),
+    'speaker_header': colors.HexColor('#3182ce'),
+    'speaker_row_alt': colors.HexColor('#ebf8ff'),
+    'positive': colors.HexColor('#38a169'),
+    'caution': colors.HexColor('#d69e2e'),
+    'negative': colors.HexColor('#e53e3e')
+}
+
+
+# Confidence score tiers, highest first; the last tier catches everything else
+CONFIDENCE_TIERS = (
+    (0.7, PALETTE['positive']),
+    (0.4, PALETTE['caution']),
+    (float('-inf'), PALETTE['negative'])
+)
+
+
+def _truncate(text: str, limit: int, suffix: str = "...") -> str:
+    """Cut text to limit characters, marking the cut with suffix."""
+    return text if len(text) <= limit else f"{text[:limit]}{suffix}"
+
+
+@lru_cache(maxsize=None)
+def _build_stylesheet(
+    font_family: str,
+    title_font_size: int,
+    heading_font_size: int,
+    body_font_size: int
+) -> StyleSheet1:
+    """Build the report stylesheet once per font configuration."""
+    styles = getSampleStyleSheet()
+    font_bold = f'{font_family}-Bold'
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='ReportTitle',
+        parent=styles['Heading1'],
+        fontName=font_bold,
+        fontSize=title_font_size,
+        alignment=TA_CENTER,
+        spaceAfter=20,
+        textColor=PALETTE['title']
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='ReportSubtitle',
+        parent=styles['Normal'],
+        fontName=font_family,
+        fontSize=12,
+        alignment=TA_CENTER,
+        spaceAfter=30,
+        textColor=PALETTE['text_muted']
+    ))
+    
+    # Section heading style
+    styles.add(ParagraphStyle(
+        name='SectionHeading',
+        parent=styles['Heading2'],
+        fontName=font_bold,
+        fontSize=heading_font_size,
+        spaceBefore=20,
+        spaceAfter=10,
+        textColor=PALETTE['heading'],
+        borderPadding=(0, 0, 5, 0)
+    ))
+    
+    # Body text style
+    styles.add(ParagraphStyle(
+        name='ReportBody',
+        parent=styles['Normal'],
+        fontName=font_family,
+        fontSize=body_font_size,
+        alignment=TA_JUSTIFY,
+        spaceAfter=10,
+        leading=14
+    ))
+    
+    # Bullet point style
+    styles.add(ParagraphStyle(
+        name='BulletPoint',
+        parent=styles['Normal'],
+        fontName=font_family,
+        fontSize=body_font_size,
+        leftIndent=20,
+        spaceAfter=6,
+        bulletIndent=10
+    ))
+    
+    # Styles shared by the per-item flowables in the builders below
+    styles.add(ParagraphStyle(
+        name='Footer',
+        parent=styles['Normal'],
+        fontName=font_family,
+        fontSize=9,
+        alignment=TA_CENTER,
+        textColor=PALETTE['text_subtle']
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='TopicSummary',
+        parent=styles['Normal'],
+        fontSize=9,
+        leftIndent=30,
+        spaceAfter=8
+    ))
+    
+    styles.add(ParagraphStyle(
+        name='Moment',
+        parent=styles['Normal'],
+        fontSize=9,
+        leftIndent=40,
+        textColor=PALETTE['text_muted']
+    ))
+    
+    return styles
+
+
+class ReportDocTemplate(BaseDocTemplate):
+    """Document template with a single full-page frame.
+    
+    The page template is registered once up front, so build() lays the story
+    out page by page without SimpleDocTemplate's per-build template setup.
+    """
+
+    def __init__(self, filename, **kwargs):
+        super().__init__(filename, **kwargs)
+        frame = Frame(
+            self.leftMargin,
+            self.bottomMargin,
+            self.width,
+            self.height,
+            id='normal'
+        )
+        self.addPageTemplates([PageTemplate(id='Report', frames=[frame])])
+
 
 class PDFGenerator:
     """Generates professional PDF meeting reports."""
 
+    # Markup templates for the sentiment section
+    SENTIMENT_COLORS = {
+        'positive': '#38a169',
+        'neutral': '#718096',
+        'negative': '#e53e3e'
+    }
+    OVERALL_TONE_TEMPLATE = (
+        "Overall Tone: <font color='{color}'><b>{label}</b></font> "
+        "(Confidence: {confidence:.0%})"
+    )
+    DISTRIBUTION_ITEM_TEMPLATE = "{label}: {percent:.1f}%"
+
+    # Fixed report text. Flowables are rebuilt from these for every report:
+    # reportlab records layout state (_postponed, canv) on the flowable itself,
+    # so an instance shared between builds breaks later or concurrent builds
+    REPORT_TITLE = "MEETING SUMMARY REPORT"
+    REPORT_SUBTITLE = "Generated by Sunny AI – Autonomous Meeting Assistant"
+    EMPTY_NOTES = {
+        'summary': "<i>No executive summary available.</i>",
+        'key_points': "<i>No key discussion points identified.</i>",
+        'decisions': "<i>No explicit decisions recorded during this meeting.</i>",
+        'action_items': "<i>No action items identified during this meeting.</i>"
+    }
+    DISCLAIMER = """
+            <i>This summary was automatically generated by Sunny AI. 
+            Please verify important details against the original meeting recording.
+            Sunny AI identifies itself as an AI assistant and requires recording consent from all participants.</i>
+            """
+    # HRFlowable arguments per rule placement
+    RULES = {
+        'header': {'thickness': 2, 'spaceAfter': 20},
+        'footer': {'thickness': 2, 'spaceBefore': 20, 'spaceAfter': 15},
+        'section': {'thickness': 1, 'spaceAfter': 10}
+    }
+
     def __init__(self, config: dict):
+        self.config = config
         pdf_config = config.get("pdf", {})
         self.font_family = pdf_config.get("font_family", "Helvetica")
+        self._font_bold = f"{self.font_family}-Bold"
         self.title_font_size = pdf_config.get("title_font_size", 18)
         self.heading_font_size = pdf_config.get("heading_font_size", 14)
         self.body_font_size = pdf_config.get("body_font_size", 11)
         self.margin = pdf_config.get("margin", 50)
+        self.max_workers = pdf_config.get("max_workers") or os.cpu_count() or 1
+        
+        # Attribute validation on reportlab objects is only useful while debugging
+        rl_config.shapeChecking = int(pdf_config.get("shape_checking", False))
         
         self.output_dir = Path(config.get("general", {}).get("output_dir", "./outputs"))
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -40,63 +236,106 @@ class PDFGenerator:
 
     def _setup_styles(self):
         """Setup PDF styles."""
-        self.styles = getSampleStyleSheet()
-        
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='ReportTitle',
-            parent=self.styles['Heading1'],
-            fontName=f'{self.font_family}-Bold',
-            fontSize=self.title_font_size,
-            alignment=TA_CENTER,
-            spaceAfter=20,
-            textColor=colors.HexColor('#1a365d')
-        ))
+        self.styles = _build_stylesheet(
+            self.font_family,
+            self.title_font_size,
+            self.heading_font_size,
+            self.body_font_size
+        )
         
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='ReportSubtitle',
-            parent=self.styles['Normal'],
-            fontName=self.font_family,
-            fontSize=12,
-            alignment=TA_CENTER,
-            spaceAfter=30,
-            textColor=colors.HexColor('#4a5568')
-        ))
+        # Meeting details table
+        self._details_table_style = TableStyle([
+            ('FONTNAME', (0, 0), (0, -1), self._font_bold),
+            ('FONTNAME', (1, 0), (1, -1), self.font_family),
+            ('FONTSIZE', (0, 0), (-1, -1), self.body_font_size),
+            ('TEXTCOLOR', (0, 0), (0, -1), PALETTE['text_muted']),
+            ('TEXTCOLOR', (1, 0), (1, -1), PALETTE['heading']),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
+            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
+        ])
         
-        # Section heading style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeading',
-            parent=self.styles['Heading2'],
-            fontName=f'{self.font_family}-Bold',
-            fontSize=self.heading_font_size,
-            spaceBefore=20,
-            spaceAfter=10,
-            textColor=colors.HexColor('#2d3748'),
-            borderPadding=(0, 0, 5, 0)
-        ))
+        # Action items table
+        self._action_table_style = TableStyle([
+            # Header row
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['heading']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), self._font_bold),
+            ('FONTSIZE', (0, 0), (-1, 0), 10),
+            ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+
+            # Data rows
+            ('FONTNAME', (0, 1), (-1, -1), self.font_family),
+            ('FONTSIZE', (0, 1), (-1, -1), 9),
+            ('ALIGN', (0, 1), (0, -1), 'LEFT'),
+            ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
+
+            # Grid
+            ('GRID', (0, 0), (-1, -1), 0.5, PALETTE['rule']),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['row_alt']]),
+
+            # Padding
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+        ])
         
-        # Body text style
-        self.styles.add(ParagraphStyle(
-            name='ReportBody',
-            parent=self.styles['Normal'],
-            fontName=self.font_family,
-            fontSize=self.body_font_size,
-            alignment=TA_JUSTIFY,
-            spaceAfter=10,
-            leading=14
-        ))
+        # Enhanced action items table
+        self._action_enhanced_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['heading']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), self._font_bold),
+            ('FONTSIZE', (0, 0), (-1, -1), 8),
+            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+            ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
+            ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+            ('GRID', (0, 0), (-1, -1), 0.5, PALETTE['rule']),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['row_alt']]),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+            ('LEFTPADDING', (0, 0), (-1, -1), 4),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 4),
+        ])
         
-        # Bullet point style
-        self.styles.add(ParagraphStyle(
-            name='BulletPoint',
-            parent=self.styles['Normal'],
-            fontName=self.font_family,
-            fontSize=self.body_font_size,
-            leftIndent=20,
-            spaceAfter=6,
-            bulletIndent=10
-        ))
+        # Analytics table
+        self._analytics_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['analytics_header']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), self._font_bold),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, PALETTE['rule']),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['analytics_row_alt']]),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+        
+        # Speaker stats table
+        self._speaker_table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), PALETTE['speaker_header']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('FONTNAME', (0, 0), (-1, 0), self._font_bold),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('GRID', (0, 0), (-1, -1), 0.5, PALETTE['rule']),
+            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PALETTE['speaker_row_alt']]),
+            ('TOPPADDING', (0, 0), (-1, -1), 6),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
+        ])
+
+    def _rule(self, placement: str) -> HRFlowable:
+        """Return a new horizontal rule for the given placement."""
+        return HRFlowable(width="100%", color=PALETTE['rule'], **self.RULES[placement])
+
+    def _empty_note(self, section: str) -> Paragraph:
+        """Return a new placeholder paragraph for an empty section."""
+        return Paragraph(self.EMPTY_NOTES[section], self.styles['ReportBody'])
+
+    def _section_header(self, title: str) -> list:
+        """Return the heading and rule that open a report section."""
+        return [Paragraph(title, self.styles['SectionHeading']), self._rule('section')]
 
     def generate_report(
         self,
@@ -124,14 +363,19 @@ class PDFGenerator:
         
         logger.info(f"Generating PDF report: {output_path}")
         
-        # Create document
-        doc = SimpleDocTemplate(
-            str(output_path),
+        # Render into memory and write the finished file in one call,
+        # rather than letting reportlab issue many small writes
+        buffer = io.BytesIO()
+        doc = ReportDocTemplate(
+            buffer,
             pagesize=letter,
             rightMargin=self.margin,
             leftMargin=self.margin,
             topMargin=self.margin,
-            bottomMargin=self.margin
+            bottomMargin=self.margin,
+            # Compress page streams and keep real timestamps (no invariant rewrite)
+            pageCompression=1,
+            invariant=0
         )
         
         # Build content
@@ -176,30 +420,46 @@ class PDFGenerator:
         
         # Build PDF
         doc.build(story)
+        output_path.write_bytes(buffer.getvalue())
         
         logger.info(f"PDF report generated successfully: {output_path}")
         return output_path
 
+    async def generate_report_async(self, *args, **kwargs) -> Path:
+        """Run generate_report in a worker thread so the event loop stays responsive.
+        
+        Takes the same arguments as generate_report; await it from async code.
+        Concurrent calls on one generator are safe: each build creates its own
+        flowables and shares only read-only styles and table styles.
+        """
+        return await asyncio.to_thread(self.generate_report, *args, **kwargs)
+
+    def generate_reports(self, jobs: List[dict]) -> List[Path]:
+        """Generate several reports in parallel worker processes.
+        
+        Each job is a dict of keyword arguments for generate_report.
+        """
+        if len(jobs) <= 1:
+            return [self.generate_report(**job) for job in jobs]
+        
+        workers = min(self.max_workers, len(jobs))
+        logger.info(f"Generating {len(jobs)} PDF reports with {workers} workers")
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_report_worker,
+            initargs=(self.config,)
+        ) as executor:
+            return list(executor.map(_generate_report_in_worker, jobs))
+
     def _build_header(self, meeting_date: datetime, platform: str, duration: str) -> list:
         """Build report header."""
         elements = []
         
-        # Title
-        elements.append(Paragraph("MEETING SUMMARY REPORT", self.styles['ReportTitle']))
-        
-        # Subtitle
-        elements.append(Paragraph(
-            "Generated by Sunny AI – Autonomous Meeting Assistant",
-            self.styles['ReportSubtitle']
-        ))
-        
-        # Horizontal line
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=2,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=20
-        ))
+        # Title, subtitle and horizontal line
+        elements.append(Paragraph(self.REPORT_TITLE, self.styles['ReportTitle']))
+        elements.append(Paragraph(self.REPORT_SUBTITLE, self.styles['ReportSubtitle']))
+        elements.append(self._rule('header'))
         
         # Meeting details table
         details_data = [
@@ -209,17 +469,7 @@ class PDFGenerator:
         ]
         
         details_table = Table(details_data, colWidths=[1.5*inch, 4*inch])
-        details_table.setStyle(TableStyle([
-            ('FONTNAME', (0, 0), (0, -1), f'{self.font_family}-Bold'),
-            ('FONTNAME', (1, 0), (1, -1), self.font_family),
-            ('FONTSIZE', (0, 0), (-1, -1), self.body_font_size),
-            ('TEXTCOLOR', (0, 0), (0, -1), colors.HexColor('#4a5568')),
-            ('TEXTCOLOR', (1, 0), (1, -1), colors.HexColor('#2d3748')),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 8),
-            ('ALIGN', (0, 0), (0, -1), 'RIGHT'),
-            ('ALIGN', (1, 0), (1, -1), 'LEFT'),
-        ]))
+        details_table.setStyle(self._details_table_style)
         
         elements.append(details_table)
         elements.append(Spacer(1, 20))
@@ -230,21 +480,12 @@ class PDFGenerator:
         """Build executive summary section."""
         elements = []
         
-        elements.append(Paragraph("EXECUTIVE SUMMARY", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("EXECUTIVE SUMMARY"))
         
         if summary:
-            elements.append(Paragraph(summary, self.styles['ReportBody']))
+            elements.append(Paragraph(escape(summary), self.styles['ReportBody']))
         else:
-            elements.append(Paragraph(
-                "<i>No executive summary available.</i>",
-                self.styles['ReportBody']
-            ))
+            elements.append(self._empty_note('summary'))
         
         elements.append(Spacer(1, 15))
         return elements
@@ -253,23 +494,13 @@ class PDFGenerator:
         """Build key discussion points section."""
         elements = []
         
-        elements.append(Paragraph("KEY DISCUSSION POINTS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("KEY DISCUSSION POINTS"))
         
         if points:
             for point in points:
-                bullet_text = f"• {point}"
-                elements.append(Paragraph(bullet_text, self.styles['BulletPoint']))
+                elements.append(Paragraph(f"• {escape(point)}", self.styles['BulletPoint']))
         else:
-            elements.append(Paragraph(
-                "<i>No key discussion points identified.</i>",
-                self.styles['ReportBody']
-            ))
+            elements.append(self._empty_note('key_points'))
         
         elements.append(Spacer(1, 15))
         return elements
@@ -278,23 +509,13 @@ class PDFGenerator:
         """Build decisions made section."""
         elements = []
         
-        elements.append(Paragraph("DECISIONS MADE", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("DECISIONS MADE"))
         
         if decisions:
             for decision in decisions:
-                bullet_text = f"✓ {decision}"
-                elements.append(Paragraph(bullet_text, self.styles['BulletPoint']))
+                elements.append(Paragraph(f"✓ {escape(decision)}", self.styles['BulletPoint']))
         else:
-            elements.append(Paragraph(
-                "<i>No explicit decisions recorded during this meeting.</i>",
-                self.styles['ReportBody']
-            ))
+            elements.append(self._empty_note('decisions'))
         
         elements.append(Spacer(1, 15))
         return elements
@@ -304,60 +525,26 @@ class PDFGenerator:
         """Build action items section."""
         elements = []
         
-        elements.append(Paragraph("ACTION ITEMS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("ACTION ITEMS"))
         
         if action_items:
             # Create table for action items
-            table_data = [['Task', 'Owner', 'Deadline']]
-            
-            for item in action_items:
-                table_data.append([
-                    item.task,
-                    item.owner or 'TBD',
-                    item.deadline or 'TBD'
-                ])
+            table_rows = [
+                [item.task, item.owner or 'TBD', item.deadline or 'TBD']
+                for item in action_items
+            ]
             
             # Calculate column widths
             col_widths = [4*inch, 1.5*inch, 1.5*inch]
             
-            action_table = Table(table_data, colWidths=col_widths)
-            action_table.setStyle(TableStyle([
-                # Header row
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), f'{self.font_family}-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-                
-                # Data rows
-                ('FONTNAME', (0, 1), (-1, -1), self.font_family),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ALIGN', (0, 1), (0, -1), 'LEFT'),
-                ('ALIGN', (1, 1), (-1, -1), 'CENTER'),
-                
-                # Grid
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-                
-                # Padding
-                ('TOPPADDING', (0, 0), (-1, -1), 8),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ]))
-            
-            elements.append(action_table)
-        else:
-            elements.append(Paragraph(
-                "<i>No action items identified during this meeting.</i>",
-                self.styles['ReportBody']
+            elements.extend(self._build_chunked_table(
+                ['Task', 'Owner', 'Deadline'],
+                table_rows,
+                col_widths,
+                self._action_table_style
             ))
+        else:
+            elements.append(self._empty_note('action_items'))
         
         elements.append(Spacer(1, 20))
         return elements
@@ -366,39 +553,25 @@ class PDFGenerator:
         """Build report footer."""
         elements = []
         
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=2,
-            color=colors.HexColor('#e2e8f0'),
-            spaceBefore=20,
-            spaceAfter=15
-        ))
+        elements.append(self._rule('footer'))
         
-        # Confidence indicator
-        confidence_text = f"Summary Confidence Score: {confidence_score:.0%}"
-        confidence_color = colors.HexColor('#38a169') if confidence_score >= 0.7 else \
-                          colors.HexColor('#d69e2e') if confidence_score >= 0.4 else \
-                          colors.HexColor('#e53e3e')
-        
-        footer_style = ParagraphStyle(
-            name='Footer',
-            parent=self.styles['Normal'],
-            fontName=self.font_family,
-            fontSize=9,
-            alignment=TA_CENTER,
-            textColor=colors.HexColor('#718096')
+        # Confidence indicator, coloured by tier
+        confidence_color = next(
+            (color for threshold, color in CONFIDENCE_TIERS if confidence_score >= threshold),
+            PALETTE['negative']
         )
+        confidence_text = (
+            f"Summary Confidence Score: "
+            f"<font color='{confidence_color.hexval()}'>{confidence_score:.0%}</font>"
+        )
+        
+        footer_style = self.styles['Footer']
         
         elements.append(Paragraph(confidence_text, footer_style))
         elements.append(Spacer(1, 10))
         
         # Disclaimer
-        disclaimer = """
-        <i>This summary was automatically generated by Sunny AI. 
-        Please verify important details against the original meeting recording.
-        Sunny AI identifies itself as an AI assistant and requires recording consent from all participants.</i>
-        """
-        elements.append(Paragraph(disclaimer, footer_style))
+        elements.append(Paragraph(self.DISCLAIMER, footer_style))
         
         # Generation timestamp
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -411,13 +584,7 @@ class PDFGenerator:
         """Build analytics summary section."""
         elements = []
         
-        elements.append(Paragraph("MEETING ANALYTICS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("MEETING ANALYTICS"))
         
         # Create analytics table
         analytics_data = [
@@ -433,17 +600,7 @@ class PDFGenerator:
         ]
         
         analytics_table = Table(analytics_data, colWidths=[2.5*inch, 2*inch])
-        analytics_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#f59e0b')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('FONTNAME', (0, 0), (-1, 0), f'{self.font_family}-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fffbeb')]),
-            ('TOPPADDING', (0, 0), (-1, -1), 6),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-        ]))
+        analytics_table.setStyle(self._analytics_table_style)
         
         elements.append(analytics_table)
         elements.append(Spacer(1, 15))
@@ -454,13 +611,7 @@ class PDFGenerator:
         """Build speaker analysis section."""
         elements = []
         
-        elements.append(Paragraph("SPEAKER ANALYSIS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("SPEAKER ANALYSIS"))
         
         elements.append(Paragraph(
             f"<b>{diarization.num_speakers}</b> speakers identified in this meeting.",
@@ -469,31 +620,25 @@ class PDFGenerator:
         
         if diarization.speaker_stats:
             # Create speaker stats table
-            speaker_data = [['Speaker', 'Speaking Time', 'Percentage']]
+            # Calculate percentage (approximate)
+            total_time = sum(diarization.speaker_stats.values())
+            pct_scale = 100 / total_time if total_time > 0 else 0
             
-            for speaker, time_seconds in diarization.speaker_stats.items():
-                minutes = int(time_seconds // 60)
-                seconds = int(time_seconds % 60)
-                time_str = f"{minutes}m {seconds}s"
-                
-                # Calculate percentage (approximate)
-                total_time = sum(diarization.speaker_stats.values())
-                pct = (time_seconds / total_time * 100) if total_time > 0 else 0
-                
-                speaker_data.append([speaker, time_str, f"{pct:.1f}%"])
+            speaker_data = [['Speaker', 'Speaking Time', 'Percentage']] + [
+                [
+                    speaker,
+                    "{}m {}s".format(*divmod(int(time_seconds), 60)),
+                    f"{time_seconds * pct_scale:.1f}%"
+                ]
+                for speaker, time_seconds in diarization.speaker_stats.items()
+            ]
             
-            speaker_table = Table(speaker_data, colWidths=[2*inch, 1.5*inch, 1.5*inch])
-            speaker_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3182ce')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), f'{self.font_family}-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 9),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#ebf8ff')]),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-            ]))
+            speaker_table = LongTable(
+                speaker_data,
+                colWidths=[2*inch, 1.5*inch, 1.5*inch],
+                repeatRows=1
+            )
+            speaker_table.setStyle(self._speaker_table_style)
             
             elements.append(speaker_table)
         
@@ -504,13 +649,7 @@ class PDFGenerator:
         """Build topic timeline section."""
         elements = []
         
-        elements.append(Paragraph("TOPIC TIMELINE", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("TOPIC TIMELINE"))
         
         for i, topic in enumerate(topics.topics, 1):
             # Format timestamps
@@ -521,19 +660,13 @@ class PDFGenerator:
             
             time_range = f"{start_min:02d}:{start_sec:02d} – {end_min:02d}:{end_sec:02d}"
             
-            topic_text = f"<b>{i}. {topic.title}</b> <font color='#718096'>({time_range})</font>"
+            topic_text = f"<b>{i}. {escape(topic.title)}</b> <font color='#718096'>({time_range})</font>"
             elements.append(Paragraph(topic_text, self.styles['BulletPoint']))
             
             if topic.summary:
                 elements.append(Paragraph(
-                    f"<font color='#4a5568'>{topic.summary}</font>",
-                    ParagraphStyle(
-                        name='TopicSummary',
-                        parent=self.styles['Normal'],
-                        fontSize=9,
-                        leftIndent=30,
-                        spaceAfter=8
-                    )
+                    f"<font color='#4a5568'>{escape(topic.summary)}</font>",
+                    self.styles['TopicSummary']
                 ))
         
         elements.append(Spacer(1, 15))
@@ -543,33 +676,26 @@ class PDFGenerator:
         """Build sentiment analysis section."""
         elements = []
         
-        elements.append(Paragraph("SENTIMENT ANALYSIS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("SENTIMENT ANALYSIS"))
         
         # Overall sentiment with color coding
-        sentiment_colors = {
-            'positive': '#38a169',
-            'neutral': '#718096',
-            'negative': '#e53e3e'
-        }
         sent_value = sentiment.overall_sentiment.value if hasattr(sentiment.overall_sentiment, 'value') else str(sentiment.overall_sentiment)
-        sent_color = sentiment_colors.get(sent_value, '#718096')
+        sent_color = self.SENTIMENT_COLORS.get(sent_value, '#718096')
         
         elements.append(Paragraph(
-            f"Overall Tone: <font color='{sent_color}'><b>{sent_value.upper()}</b></font> "
-            f"(Confidence: {sentiment.overall_confidence:.0%})",
+            self.OVERALL_TONE_TEMPLATE.format(
+                color=sent_color,
+                label=sent_value.upper(),
+                confidence=sentiment.overall_confidence
+            ),
             self.styles['ReportBody']
         ))
         
         # Sentiment distribution
         if sentiment.sentiment_distribution:
+            format_item = self.DISTRIBUTION_ITEM_TEMPLATE.format
             dist_text = " | ".join([
-                f"{k.title()}: {v:.1f}%" 
+                format_item(label=k.title(), percent=v)
                 for k, v in sentiment.sentiment_distribution.items()
             ])
             elements.append(Paragraph(f"Distribution: {dist_text}", self.styles['BulletPoint']))
@@ -592,14 +718,8 @@ class PDFGenerator:
             elements.append(Paragraph("<b>Key Moments:</b>", self.styles['BulletPoint']))
             for moment in sentiment.key_emotional_moments[:3]:
                 elements.append(Paragraph(
-                    f"• <i>{moment[:100]}...</i>" if len(moment) > 100 else f"• <i>{moment}</i>",
-                    ParagraphStyle(
-                        name='Moment',
-                        parent=self.styles['Normal'],
-                        fontSize=9,
-                        leftIndent=40,
-                        textColor=colors.HexColor('#4a5568')
-                    )
+                    f"• <i>{escape(_truncate(moment, 100))}</i>",
+                    self.styles['Moment']
                 ))
         
         elements.append(Spacer(1, 15))
@@ -609,13 +729,7 @@ class PDFGenerator:
         """Build enhanced action items section with priorities."""
         elements = []
         
-        elements.append(Paragraph("ACTION ITEMS", self.styles['SectionHeading']))
-        elements.append(HRFlowable(
-            width="100%",
-            thickness=1,
-            color=colors.HexColor('#e2e8f0'),
-            spaceAfter=10
-        ))
+        elements.extend(self._section_header("ACTION ITEMS"))
         
         # Summary stats
         elements.append(Paragraph(
@@ -628,48 +742,66 @@ class PDFGenerator:
         
         if action_items.items:
             # Create enhanced table
-            table_data = [['#', 'Task', 'Owner', 'Deadline', 'Priority']]
-            
             priority_colors = {
-                'High': colors.HexColor('#e53e3e'),
-                'Medium': colors.HexColor('#d69e2e'),
-                'Low': colors.HexColor('#38a169')
+                'High': PALETTE['negative'],
+                'Medium': PALETTE['caution'],
+                'Low': PALETTE['positive']
             }
             
-            for item in action_items.items:
-                table_data.append([
+            table_rows = [
+                [
                     str(item.id),
-                    item.task[:50] + "..." if len(item.task) > 50 else item.task,
+                    _truncate(item.task, 50),
                     item.owner or 'TBD',
                     item.deadline or 'TBD',
                     item.priority
-                ])
+                ]
+                for item in action_items.items
+            ]
             
             col_widths = [0.4*inch, 3.2*inch, 1*inch, 1*inch, 0.8*inch]
             
-            action_table = Table(table_data, colWidths=col_widths)
-            action_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-                ('FONTNAME', (0, 0), (-1, 0), f'{self.font_family}-Bold'),
-                ('FONTSIZE', (0, 0), (-1, -1), 8),
-                ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-                ('ALIGN', (2, 0), (-1, -1), 'CENTER'),
-                ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-                ('GRID', (0, 0), (-1, -1), 0.5, colors.HexColor('#e2e8f0')),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f7fafc')]),
-                ('TOPPADDING', (0, 0), (-1, -1), 6),
-                ('BOTTOMPADDING', (0, 0), (-1, -1), 6),
-                ('LEFTPADDING', (0, 0), (-1, -1), 4),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 4),
-            ]))
-            
-            elements.append(action_table)
-        else:
-            elements.append(Paragraph(
-                "<i>No action items identified during this meeting.</i>",
-                self.styles['ReportBody']
+            elements.extend(self._build_chunked_table(
+                ['#', 'Task', 'Owner', 'Deadline', 'Priority'],
+                table_rows,
+                col_widths,
+                self._action_enhanced_table_style
             ))
+        else:
+            elements.append(self._empty_note('action_items'))
         
         elements.append(Spacer(1, 20))
         return elements
+
+    def _build_chunked_table(
+        self,
+        header: list,
+        rows: list,
+        col_widths: list,
+        style: TableStyle
+    ) -> list:
+        """Split rows into fixed-size tables that each repeat the header."""
+        tables = []
+        
+        for start in range(0, len(rows), ACTION_TABLE_ROWS_PER_CHUNK):
+            chunk = rows[start:start + ACTION_TABLE_ROWS_PER_CHUNK]
+            table = LongTable([header] + chunk, colWidths=col_widths, repeatRows=1)
+            table.setStyle(style)
+            tables.append(table)
+        
+        return tables
+
+
+# Generator owned by each worker process of PDFGenerator.generate_reports
+_worker_generator: Optional[PDFGenerator] = None
+
+
+def _init_report_worker(config: dict) -> None:
+    """Build one generator per worker so styles are set up once per process."""
+    global _worker_generator
+    _worker_generator = PDFGenerator(config)
+
+
+def _generate_report_in_worker(job: dict) -> Path:
+    """Generate a single report inside a worker process."""
+    return _worker_generator.generate_report(**job)
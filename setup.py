@@ -4,53 +4,68 @@ Sunny AI Setup Script
 Verifies installation and configures the environment.
 """
 
+import re
 import subprocess
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
+from importlib.metadata import distributions
 from pathlib import Path
 
 
-def check_python_version():
+def check_python_version(log=print):
     """Check Python version."""
-    print("Checking Python version...")
+    log("Checking Python version...")
     version = sys.version_info
     if version.major < 3 or (version.major == 3 and version.minor < 10):
-        print(f"❌ Python 3.10+ required. Found: {version.major}.{version.minor}")
+        log(f"❌ Python 3.10+ required. Found: {version.major}.{version.minor}")
         return False
-    print(f"✅ Python {version.major}.{version.minor}.{version.micro}")
+    log(f"✅ Python {version.major}.{version.minor}.{version.micro}")
     return True
 
 
-def check_dependencies():
+def _normalize_dist_name(name: str) -> str:
+    """Normalize a distribution name for comparison (PEP 503)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def check_dependencies(log=print):
     """Check if required packages are installed."""
-    print("\nChecking dependencies...")
-    
-    required = [
-        "playwright",
-        "whisper",
-        "ollama",
-        "reportlab",
-        "fastapi",
-        "structlog",
-        "sounddevice",
-        "aiosqlite"
-    ]
+    log("\nChecking dependencies...")
+    
+    # Module name -> distribution name; only package metadata is read,
+    # so heavy packages like whisper are not imported
+    required = {
+        "playwright": "playwright",
+        "whisper": "openai-whisper",
+        "ollama": "ollama",
+        "reportlab": "reportlab",
+        "fastapi": "fastapi",
+        "structlog": "structlog",
+        "sounddevice": "sounddevice",
+        "aiosqlite": "aiosqlite"
+    }
+    
+    installed = {
+        _normalize_dist_name(dist.metadata["Name"])
+        for dist in distributions()
+        if dist.metadata["Name"]
+    }
     
     missing = []
-    for package in required:
-        try:
-            __import__(package)
-            print(f"  ✅ {package}")
-        except ImportError:
-            print(f"  ❌ {package} - NOT INSTALLED")
+    for package, dist_name in required.items():
+        if _normalize_dist_name(dist_name) in installed:
+            log(f"  ✅ {package}")
+        else:
+            log(f"  ❌ {package} - NOT INSTALLED")
             missing.append(package)
     
     return len(missing) == 0
 
 
-def check_playwright_browsers():
+def check_playwright_browsers(log=print):
     """Check if Playwright browsers are installed."""
-    print("\nChecking Playwright browsers...")
+    log("\nChecking Playwright browsers...")
     try:
         result = subprocess.run(
             ["playwright", "install", "--dry-run", "chromium"],
@@ -58,52 +73,52 @@ def check_playwright_browsers():
             text=True
         )
         if "chromium" in result.stdout.lower() or result.returncode == 0:
-            print("  ✅ Chromium browser available")
+            log("  ✅ Chromium browser available")
             return True
     except Exception:
         pass
     
-    print("  ❌ Chromium not installed. Run: playwright install chromium")
+    log("  ❌ Chromium not installed. Run: playwright install chromium")
     return False
 
 
-def check_ollama():
+def check_ollama(log=print):
     """Check if Ollama is running."""
-    print("\nChecking Ollama...")
+    log("\nChecking Ollama...")
     try:
         import httpx
         response = httpx.get("http://localhost:11434/api/tags", timeout=5)
         if response.status_code == 200:
             models = response.json().get("models", [])
-            print(f"  ✅ Ollama is running")
+            log(f"  ✅ Ollama is running")
             if models:
-                print(f"  📦 Available models: {', '.join(m['name'] for m in models)}")
+                log(f"  📦 Available models: {', '.join(m['name'] for m in models)}")
             else:
-                print("  ⚠️  No models installed. Run: ollama pull llama3")
+                log("  ⚠️  No models installed. Run: ollama pull llama3")
             return True
     except Exception:
         pass
     
-    print("  ❌ Ollama not running. Start with: ollama serve")
+    log("  ❌ Ollama not running. Start with: ollama serve")
     return False
 
 
-def check_environment():
+def check_environment(log=print):
     """Check environment variables."""
-    print("\nChecking environment variables...")
+    log("\nChecking environment variables...")
     
     gmail = os.getenv("GMAIL_ADDRESS")
     password = os.getenv("GMAIL_APP_PASSWORD")
     
     if gmail:
-        print(f"  ✅ GMAIL_ADDRESS: {gmail[:3]}***@***")
+        log(f"  ✅ GMAIL_ADDRESS: {gmail[:3]}***@***")
     else:
-        print("  ⚠️  GMAIL_ADDRESS not set (email delivery will fail)")
+        log("  ⚠️  GMAIL_ADDRESS not set (email delivery will fail)")
     
     if password:
-        print(f"  ✅ GMAIL_APP_PASSWORD: ****")
+        log(f"  ✅ GMAIL_APP_PASSWORD: ****")
     else:
-        print("  ⚠️  GMAIL_APP_PASSWORD not set (email delivery will fail)")
+        log("  ⚠️  GMAIL_APP_PASSWORD not set (email delivery will fail)")
     
     return bool(gmail and password)
 
@@ -123,14 +138,26 @@ def main():
     print("☀️  SUNNY AI - Setup Verification")
     print("="*60)
     
-    results = {
-        "Python": check_python_version(),
-        "Dependencies": check_dependencies(),
-        "Playwright": check_playwright_browsers(),
-        "Ollama": check_ollama(),
-        "Environment": check_environment()
+    checks = {
+        "Python": check_python_version,
+        "Dependencies": check_dependencies,
+        "Playwright": check_playwright_browsers,
+        "Ollama": check_ollama,
+        "Environment": check_environment
     }
     
+    # Run the checks concurrently; each buffers its output so it prints in order
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        outputs = {name: [] for name in checks}
+        futures = {
+            name: executor.submit(check, outputs[name].append)
+            for name, check in checks.items()
+        }
+        results = {}
+        for name, future in futures.items():
+            results[name] = future.result()
+            print("\n".join(outputs[name]))
+    
     create_directories()
     
     print("\n" + "="*60)
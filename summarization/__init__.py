@@ -1,4 +1,5 @@
 # Summarization Module
 from .llm_pipeline import LLMPipeline, MeetingSummary
+from .semantic_cache import SemanticCache
 
-__all__ = ["LLMPipeline", "MeetingSummary"]
+__all__ = ["LLMPipeline", "MeetingSummary", "SemanticCache"]
@@ -3,16 +3,39 @@ LLM Pipeline for Meeting Summarization
 Supports Google Gemini AI and Ollama for intelligent summarization.
 """
 
+import ast
 import asyncio
 import json
-import os
 import re
-from typing import List, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 import structlog
+from tenacity import retry, stop_after_attempt, wait_exponential
+
+from utils.key_store import get_api_key
+from .semantic_cache import SemanticCache
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so the existing
+# handlers cover both parsers
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
 logger = structlog.get_logger(__name__)
 
+# Terminal states of a Gemini batch job
+BATCH_DONE_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
 
 @dataclass
 class ActionItem:
@@ -34,6 +57,292 @@ class MeetingSummary:
     raw_transcript: str = ""
 
 
+# Characters of transcript included in single-pass extraction prompts
+PROMPT_TRANSCRIPT_CHARS = 8000
+
+# Every template opens with the transcript so that calls over the same
+# transcript share the system instruction + transcript prefix, which the
+# provider can serve from its prompt cache instead of prefilling it again
+TRANSCRIPT_PREFIX = """Meeting transcript:
+{transcript}
+
+"""
+
+EXECUTIVE_SUMMARY_PROMPT = TRANSCRIPT_PREFIX + """Based on the transcript above, write an executive summary.
+
+Requirements:
+- Maximum 200 words
+- Capture the main purpose and outcomes of the meeting
+- Be factual and objective
+- Use professional business language
+
+Executive Summary:"""
+
+KEY_POINTS_PROMPT = TRANSCRIPT_PREFIX + """Extract the key discussion points from the transcript above.
+
+Requirements:
+- List 5-10 main topics or points discussed
+- Each point should be a single, clear sentence
+- Only include what was actually discussed
+- Format as a numbered list
+
+Key Discussion Points:"""
+
+DECISIONS_PROMPT = TRANSCRIPT_PREFIX + """Extract any decisions that were made during the meeting above.
+
+Requirements:
+- Only include explicit decisions that were agreed upon
+- Each decision should be a clear, actionable statement
+- If no clear decisions were made, respond with "No explicit decisions recorded"
+- Format as a numbered list
+
+Decisions Made:"""
+
+ACTION_ITEMS_PROMPT = TRANSCRIPT_PREFIX + """Extract action items from the transcript above.
+
+For each action item, identify:
+- Task: What needs to be done
+- Owner: Who is responsible (if mentioned)
+- Deadline: When it's due (if mentioned)
+
+Format your response as JSON array:
+[
+  {{"task": "description", "owner": "name or null", "deadline": "date or null"}},
+  ...
+]
+
+If no action items, return: []
+
+Action Items (JSON only, no other text):"""
+
+SUMMARY_PROMPT = TRANSCRIPT_PREFIX + """Analyze the transcript above and return a single JSON object with:
+- "executive_summary": at most 200 words on the main purpose and outcomes, in professional business language
+- "key_points": 5-10 main topics or points discussed, one clear sentence each
+- "decisions": explicit decisions agreed upon, as clear actionable statements ([] if none)
+- "action_items": tasks as objects with "task", "owner" (name or null) and "deadline" (date or null) ([] if none)
+
+Only include what was actually said.
+
+JSON:"""
+
+# Response schemas for Gemini structured output
+ACTION_ITEMS_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "task": {"type": "STRING"},
+            "owner": {"type": "STRING", "nullable": True},
+            "deadline": {"type": "STRING", "nullable": True},
+            "priority": {"type": "STRING"},
+        },
+        "required": ["task"],
+    },
+}
+
+SUMMARY_SCHEMA = {
+    "type": "OBJECT",
+    "properties": {
+        "executive_summary": {"type": "STRING"},
+        "key_points": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "decisions": {"type": "ARRAY", "items": {"type": "STRING"}},
+        "action_items": ACTION_ITEMS_SCHEMA,
+    },
+    "required": ["executive_summary", "key_points", "decisions", "action_items"],
+}
+
+RESPONSE_SCHEMAS = {
+    "action_items": ACTION_ITEMS_SCHEMA,
+    "summary": SUMMARY_SCHEMA,
+}
+
+# Sentence and paragraph boundaries used to align transcript chunks
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+|\n{2,}")
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Load the tiktoken encoding used for token counts, if available.
+    
+    Failures are cached as None too, so a host that cannot download the
+    encoding falls back to estimates instead of retrying on every call.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed, estimating token counts from length")
+        return None
+    try:
+        # The BPE file is downloaded on first use
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load tiktoken encoding ({e}), estimating token counts from length")
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Count tokens in text; roughly four characters per token without tiktoken."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return max(1, len(text) // 4)
+    return len(encoding.encode(text))
+
+
+# Numbering and bullet markers stripped from list lines in one pass,
+# e.g. "1. ", "2) ", "- ", "• " or "1. - "
+_LIST_MARKER = re.compile(r"^(?:\d+[.)]\s*)?(?:[-•*]\s*)?")
+_ACTION_MARKER = re.compile(r"^\d+[.)\-]\s*")
+_LINE = re.compile(r"[^\n]+")
+
+
+def _iter_lines(text: str):
+    """Yield the stripped, non-empty lines of text without building a list."""
+    for match in _LINE.finditer(text):
+        line = match.group().strip()
+        if line:
+            yield line
+
+
+_CODE_FENCE = re.compile(r"```(?:json)?", re.IGNORECASE)
+_LINE_COMMENT = re.compile(r"^\s*//.*$", re.MULTILINE)
+_TRAILING_COMMA = re.compile(r",(\s*[\]}])")
+_CLOSERS = {"[": "]", "{": "}"}
+
+
+def _close_brackets(text: str) -> str:
+    """Append closers for any brackets or string left open at the end of text."""
+    stack = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            stack.append(_CLOSERS[char])
+        elif char in "]}" and stack:
+            stack.pop()
+    
+    if in_string:
+        text += '"'
+    return text + "".join(reversed(stack))
+
+
+def _parse_json_array(text: str) -> Optional[list]:
+    """Parse a JSON array from LLM output, repairing common mistakes.
+    
+    Handles markdown fences, surrounding prose, // comments, trailing commas,
+    single quotes and truncated output. Returns [] when the text holds no
+    array and None when an array is present but cannot be recovered.
+    """
+    text = _CODE_FENCE.sub("", text).strip()
+    
+    start = text.find("[")
+    if start == -1:
+        return []
+    end = text.rfind("]")
+    candidate = text[start:end + 1] if end > start else text[start:]
+    
+    repaired = _LINE_COMMENT.sub("", candidate)
+    repaired = _TRAILING_COMMA.sub(r"\1", _close_brackets(repaired))
+    
+    for attempt in (candidate, repaired):
+        try:
+            result = _json_loads(attempt)
+        except (json.JSONDecodeError, RecursionError):
+            continue
+        if isinstance(result, list):
+            return result
+    
+    # Python-style literals: single quotes, None, True/False
+    try:
+        result = ast.literal_eval(repaired)
+    except (ValueError, SyntaxError, TypeError, MemoryError, RecursionError):
+        # Malformed output can build unhashable keys or nest too deeply
+        return None
+    return result if isinstance(result, list) else None
+
+
+
+def _parse_json_object(text: str) -> Optional[dict]:
+    """Parse a single JSON object from LLM output, or None if it cannot be recovered.
+    
+    Truncated output is not repaired, since closing it would silently drop fields.
+    """
+    text = _CODE_FENCE.sub("", text).strip()
+    
+    start = text.find("{")
+    end = text.rfind("}")
+    if start == -1 or end <= start:
+        return None
+    
+    candidate = _TRAILING_COMMA.sub(r"\1", _LINE_COMMENT.sub("", text[start:end + 1]))
+    try:
+        result = _json_loads(candidate)
+    except json.JSONDecodeError:
+        return None
+    return result if isinstance(result, dict) else None
+
+async def _iter_json_array_items(fragments: AsyncIterator[str]) -> AsyncIterator[dict]:
+    """Yield each object of a streamed JSON array as soon as its closing brace arrives.
+    
+    Only the first array in the stream is used, so a wrapper object such as
+    {"action_items": [...]} is handled too; the rest of the stream is consumed
+    but ignored. Objects that fail to parse are skipped.
+    """
+    depth = 0
+    array_depth = None
+    in_string = False
+    escaped = False
+    capturing = False
+    finished = False
+    buffer: List[str] = []
+    
+    async for fragment in fragments:
+        if finished:
+            continue
+        for char in fragment:
+            if capturing:
+                buffer.append(char)
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif char == "\\":
+                    escaped = True
+                elif char == '"':
+                    in_string = False
+                continue
+            
+            if char == '"':
+                in_string = True
+            elif char in "[{":
+                if char == "[" and array_depth is None:
+                    array_depth = depth + 1
+                elif char == "{" and depth == array_depth and not capturing:
+                    capturing = True
+                    buffer = ["{"]
+                depth += 1
+            elif char in "]}":
+                depth -= 1
+                if char == "]" and array_depth is not None and depth == array_depth - 1:
+                    finished = True
+                    break
+                if capturing and depth == array_depth:
+                    capturing = False
+                    try:
+                        item = _json_loads("".join(buffer))
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(item, dict):
+                        yield item
+
+
 class LLMPipeline:
     """LLM-based meeting summarization pipeline using Gemini or Ollama."""
 
@@ -61,7 +370,7 @@ Rules:
         self.provider = sum_config.get("provider", "gemini")
         
         # Gemini settings
-        self.gemini_api_key = os.getenv("GEMINI_API_KEY", sum_config.get("gemini_api_key", ""))
+        self.gemini_api_key = get_api_key("GEMINI_API_KEY") or sum_config.get("gemini_api_key", "")
         self.gemini_model = sum_config.get("gemini_model", "gemini-1.5-flash")
         
         # Ollama settings (fallback)
@@ -74,8 +383,34 @@ Rules:
         self.chunk_size = sum_config.get("chunk_size_tokens", 4000)
         self.overlap = sum_config.get("overlap_tokens", 200)
         
+        # "batch" sends chunk summaries through the Gemini Batch API (cheaper, slower)
+        self.mode = sum_config.get("mode", "realtime")
+        self.batch_poll_interval = sum_config.get("batch_poll_interval_seconds", 30)
+        self.batch_timeout = sum_config.get("batch_timeout_minutes", 120) * 60
+        
+        # Independent prompts run concurrently, capped to respect provider rate limits
+        self.max_concurrent_requests = sum_config.get("max_concurrent_requests", 4)
+        self._request_semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests,
+            thread_name_prefix="llm-call"
+        )
+        
+        # Response cache: exact prompt matches, plus near-duplicates when semantic
+        self._cache = None
+        if sum_config.get("cache_enabled", True):
+            self._cache = SemanticCache(
+                ttl_seconds=sum_config.get("cache_ttl_seconds", 3600),
+                similarity_threshold=sum_config.get("cache_similarity_threshold", 0.92),
+                semantic=sum_config.get("semantic_cache", False)
+            )
+        
+        # Ollama HTTP client, created on first use
+        self._http = None
+        
         # Initialize Gemini
         self._gemini_model = None
+        self._gemini_json_models = {}
         if self.provider == "gemini" and self.gemini_api_key:
             self._init_gemini()
 
@@ -108,37 +443,63 @@ Rules:
                 system_instruction=self.SYSTEM_PROMPT
             )
             
+            # One model per response schema, constrained to emit schema-valid JSON
+            self._gemini_json_models = {
+                name: genai.GenerativeModel(
+                    model_name=self.gemini_model,
+                    generation_config={
+                        **generation_config,
+                        "response_mime_type": "application/json",
+                        "response_schema": response_schema,
+                    },
+                    safety_settings=safety_settings,
+                    system_instruction=self.SYSTEM_PROMPT
+                )
+                for name, response_schema in RESPONSE_SCHEMAS.items()
+            }
+            
             logger.info(f"Gemini initialized with model: {self.gemini_model}")
             
         except Exception as e:
             logger.error(f"Failed to initialize Gemini: {e}")
             self._gemini_model = None
+            self._gemini_json_models = {}
+
+    def _sync_api_key(self) -> None:
+        """Pick up a Gemini key stored at runtime, re-initializing Gemini if it changed."""
+        if self.provider != "gemini":
+            return
+        api_key = get_api_key("GEMINI_API_KEY")
+        if api_key and api_key != self.gemini_api_key:
+            logger.info("Gemini API key changed, re-initializing Gemini")
+            self.gemini_api_key = api_key
+            self._init_gemini()
 
     async def check_available(self) -> bool:
         """Check if the LLM provider is available."""
+        self._sync_api_key()
         if self.provider == "gemini":
             return self._gemini_model is not None
         else:
             # Check Ollama
             try:
-                import httpx
-                async with httpx.AsyncClient(timeout=5) as client:
-                    response = await client.get(f"{self.ollama_base_url}/api/tags")
-                    return response.status_code == 200
+                response = await self._get_http_client().get("/api/tags", timeout=5)
+                return response.status_code == 200
             except Exception:
                 return False
 
-    async def _call_gemini(self, prompt: str) -> str:
+    async def _call_gemini(self, prompt: str, schema: Optional[str] = None) -> str:
         """Make a call to Gemini API."""
-        if not self._gemini_model:
+        model = self._gemini_json_models.get(schema) if schema else self._gemini_model
+        if not model:
             raise RuntimeError("Gemini not initialized")
         
         try:
             # Run in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
-                None,
-                lambda: self._gemini_model.generate_content(prompt)
+                self._executor,
+                lambda: model.generate_content(prompt)
             )
             
             return response.text
@@ -147,54 +508,181 @@ Rules:
             logger.error(f"Gemini API call failed: {e}")
             raise
 
-    async def _call_ollama(self, prompt: str) -> str:
-        """Make a call to Ollama API."""
-        import httpx
-        
+    def _ollama_payload(self, prompt: str, schema: Optional[str], stream: bool) -> dict:
+        """Build the request body for Ollama's generate endpoint."""
         payload = {
             "model": self.ollama_model,
             "prompt": f"{self.SYSTEM_PROMPT}\n\n{prompt}",
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": self.temperature,
                 "num_predict": self.max_tokens
             }
         }
-        
-        async with httpx.AsyncClient(timeout=120) as client:
-            response = await client.post(
-                f"{self.ollama_base_url}/api/generate",
-                json=payload
+        if schema:
+            payload["format"] = "json"
+        return payload
+
+    def _get_http_client(self):
+        """Return the pooled Ollama HTTP client, creating it on first use."""
+        if self._http is None:
+            import httpx
+            
+            # Kept-alive connections are reused across all Ollama requests
+            self._http = httpx.AsyncClient(
+                base_url=self.ollama_base_url,
+                timeout=120,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=8)
             )
+        return self._http
+
+    async def _call_ollama(self, prompt: str, schema: Optional[str] = None) -> str:
+        """Make a call to Ollama API."""
+        payload = self._ollama_payload(prompt, schema, stream=False)
+        
+        response = await self._get_http_client().post("/api/generate", json=payload)
+        response.raise_for_status()
+        return _json_loads(response.content).get("response", "")
+
+    async def _stream_gemini(self, prompt: str, schema: Optional[str] = None) -> AsyncIterator[str]:
+        """Yield Gemini response text as it is generated."""
+        model = self._gemini_json_models.get(schema) if schema else self._gemini_model
+        if not model:
+            raise RuntimeError("Gemini not initialized")
+        
+        # The SDK stream is blocking, so drain it on the executor into a queue
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        finished = object()
+        
+        def produce():
+            try:
+                for chunk in model.generate_content(prompt, stream=True):
+                    loop.call_soon_threadsafe(queue.put_nowait, chunk.text)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, finished)
+        
+        producer = loop.run_in_executor(self._executor, produce)
+        try:
+            while True:
+                item = await queue.get()
+                if item is finished:
+                    break
+                if isinstance(item, Exception):
+                    logger.error(f"Gemini streaming call failed: {item}")
+                    raise item
+                yield item
+        finally:
+            await producer
+
+    async def _stream_ollama(self, prompt: str, schema: Optional[str] = None) -> AsyncIterator[str]:
+        """Yield Ollama response text as it is generated."""
+        payload = self._ollama_payload(prompt, schema, stream=True)
+        
+        async with self._get_http_client().stream(
+            "POST",
+            "/api/generate",
+            json=payload
+        ) as response:
             response.raise_for_status()
-            return response.json().get("response", "")
+            async for line in response.aiter_lines():
+                if line:
+                    text = _json_loads(line).get("response", "")
+                    if text:
+                        yield text
 
-    async def _call_llm(self, prompt: str) -> str:
-        """Call the configured LLM provider."""
-        if self.provider == "gemini" and self._gemini_model:
-            return await self._call_gemini(prompt)
-        else:
-            return await self._call_ollama(prompt)
+    async def _stream_llm(self, prompt: str, schema: Optional[str] = None) -> AsyncIterator[str]:
+        """Stream a response from the configured LLM provider."""
+        self._sync_api_key()
+        async with self._request_semaphore:
+            if self.provider == "gemini" and self._gemini_model:
+                stream = self._stream_gemini(prompt, schema)
+            else:
+                stream = self._stream_ollama(prompt, schema)
+            async for text in stream:
+                yield text
+
+    async def _call_llm(self, prompt: str, schema: Optional[str] = None) -> str:
+        """Call the configured LLM provider.
+        
+        With schema (a RESPONSE_SCHEMAS key) the provider is asked to return JSON
+        matching that schema only.
+        """
+        self._sync_api_key()
+        use_gemini = self.provider == "gemini" and self._gemini_model
+        namespace = f"{self.gemini_model if use_gemini else self.ollama_model}:{schema}"
+        
+        if self._cache:
+            cached = await self._cache.get(prompt, namespace)
+            if cached is not None:
+                return cached
+        
+        async with self._request_semaphore:
+            if use_gemini:
+                response = await self._call_gemini(prompt, schema)
+            else:
+                response = await self._call_ollama(prompt, schema)
+        
+        if self._cache:
+            await self._cache.put(prompt, response, namespace)
+        return response
 
     def _chunk_transcript(self, transcript: str) -> List[str]:
-        """Split transcript into chunks for processing."""
-        words = transcript.split()
-        chunks = []
+        """Split transcript into sentence-aligned chunks of at most chunk_size tokens.
         
-        chunk_words = self.chunk_size
-        overlap_words = self.overlap
+        Consecutive chunks share up to overlap tokens of trailing sentences.
+        """
+        units = []
+        for sentence in _SENTENCE_BOUNDARY.split(transcript.strip()):
+            if not sentence:
+                continue
+            tokens = _count_tokens(sentence)
+            if tokens <= self.chunk_size:
+                units.append((sentence, tokens))
+            else:
+                units.extend(self._split_long_sentence(sentence))
         
-        i = 0
-        while i < len(words):
-            chunk_end = min(i + chunk_words, len(words))
-            chunk = " ".join(words[i:chunk_end])
-            chunks.append(chunk)
-            i += chunk_words - overlap_words
+        chunks = []
+        current, current_tokens = [], 0
+        for sentence, tokens in units:
+            if current and current_tokens + tokens > self.chunk_size:
+                chunks.append(" ".join(text for text, _ in current))
+                
+                # Carry trailing sentences into the next chunk for context
+                carry, carry_tokens = [], 0
+                for unit in reversed(current):
+                    if carry_tokens + unit[1] > self.overlap:
+                        break
+                    carry.insert(0, unit)
+                    carry_tokens += unit[1]
+                if carry_tokens + tokens > self.chunk_size:
+                    carry, carry_tokens = [], 0
+                current, current_tokens = carry, carry_tokens
             
-            if chunk_end >= len(words):
-                break
+            current.append((sentence, tokens))
+            current_tokens += tokens
+        
+        if current:
+            chunks.append(" ".join(text for text, _ in current))
+        
+        return chunks or [transcript]
 
-        return chunks
+    def _split_long_sentence(self, sentence: str) -> List[tuple]:
+        """Break a sentence longer than chunk_size into word runs that fit."""
+        pieces = []
+        current, current_tokens = [], 0
+        for word in sentence.split():
+            tokens = _count_tokens(f" {word}")
+            if current and current_tokens + tokens > self.chunk_size:
+                pieces.append((" ".join(current), current_tokens))
+                current, current_tokens = [], 0
+            current.append(word)
+            current_tokens += tokens
+        if current:
+            pieces.append((" ".join(current), current_tokens))
+        return pieces
 
     async def summarize_transcript(self, transcript: str) -> MeetingSummary:
         """Generate a complete meeting summary from transcript."""
@@ -219,17 +707,19 @@ Rules:
     async def _summarize_single(self, transcript: str) -> MeetingSummary:
         """Summarize a single transcript chunk."""
         
-        # Generate executive summary
-        exec_summary = await self._generate_executive_summary(transcript)
+        transcript_head = transcript[:PROMPT_TRANSCRIPT_CHARS]
         
-        # Extract key points
-        key_points = await self._extract_key_points(transcript)
-        
-        # Extract decisions
-        decisions = await self._extract_decisions(transcript)
-        
-        # Extract action items
-        action_items = await self._extract_action_items(transcript)
+        # One multi-task call sends the transcript once; if its JSON comes back
+        # truncated or incomplete, fall back to the four per-field extractions
+        fields = await self._generate_combined_summary(transcript_head)
+        if fields is None:
+            fields = await asyncio.gather(
+                self._generate_executive_summary(transcript_head),
+                self._extract_key_points(transcript_head),
+                self._extract_decisions(transcript_head),
+                self._extract_action_items(transcript_head)
+            )
+        exec_summary, key_points, decisions, action_items = fields
         
         # Calculate confidence score
         confidence = self._calculate_confidence(exec_summary, key_points, decisions, action_items)
@@ -246,11 +736,36 @@ Rules:
     async def _summarize_chunked(self, chunks: List[str], full_transcript: str) -> MeetingSummary:
         """Summarize multiple transcript chunks and combine."""
         
-        chunk_summaries = []
-        for i, chunk in enumerate(chunks):
-            logger.info(f"Processing chunk {i+1}/{len(chunks)}")
-            
-            prompt = f"""Summarize this portion of a meeting transcript. Extract:
+        chunk_summaries = None
+        if self.mode == "batch" and self.provider == "gemini":
+            chunk_summaries = await self._summarize_chunks_batch(chunks)
+        
+        if chunk_summaries is None:
+            # Chunks are summarized concurrently; _call_llm bounds the fan-out
+            # and gather keeps the results in transcript order
+            chunk_summaries = await asyncio.gather(*[
+                self._summarize_chunk(chunk, i, len(chunks))
+                for i, chunk in enumerate(chunks)
+            ])
+
+        combined_summary = "\n\n".join([
+            f"[Part {i+1}]\n{s}" for i, s in enumerate(chunk_summaries)
+        ])
+
+        return await self._generate_final_summary(combined_summary, full_transcript)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=10)
+    )
+    async def _summarize_chunk(self, chunk: str, index: int, total: int) -> str:
+        """Summarize one portion of a chunked transcript."""
+        logger.info(f"Processing chunk {index+1}/{total}")
+        return await self._call_llm(self._chunk_prompt(chunk))
+
+    def _chunk_prompt(self, chunk: str) -> str:
+        """Build the summarization prompt for one transcript chunk."""
+        return f"""Summarize this portion of a meeting transcript. Extract:
 1. Main topics discussed
 2. Any decisions mentioned
 3. Any action items or tasks assigned
@@ -259,30 +774,108 @@ Transcript portion:
 {chunk}
 
 Provide a concise summary:"""
-            
-            summary = await self._call_llm(prompt)
-            chunk_summaries.append(summary)
 
-        combined_summary = "\n\n".join([
-            f"[Part {i+1}]\n{s}" for i, s in enumerate(chunk_summaries)
-        ])
-
-        return await self._generate_final_summary(combined_summary, full_transcript)
-
-    async def _generate_executive_summary(self, transcript: str) -> str:
-        """Generate executive summary (max 200 words)."""
-        prompt = f"""Based on this meeting transcript, write an executive summary.
+    async def _summarize_chunks_batch(self, chunks: List[str]) -> Optional[List[str]]:
+        """Summarize chunks with one Gemini batch job.
+        
+        Returns None when the batch path is unavailable or fails, so the
+        caller can fall back to realtime requests.
+        """
+        try:
+            from google import genai
+        except ImportError:
+            logger.warning("google-genai not installed. Using realtime summarization.")
+            return None
+        
+        self._sync_api_key()
+        prompts = [self._chunk_prompt(chunk) for chunk in chunks]
+        logger.info(f"Submitting {len(prompts)} chunk(s) as a Gemini batch job")
+        
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._executor,
+                self._run_gemini_batch,
+                genai,
+                prompts
+            )
+        except Exception as e:
+            logger.error(f"Gemini batch job failed, using realtime summarization: {e}")
+            return None
 
-Requirements:
-- Maximum 200 words
-- Capture the main purpose and outcomes of the meeting
-- Be factual and objective
-- Use professional business language
+    def _run_gemini_batch(self, genai, prompts: List[str]) -> List[str]:
+        """Create a Gemini batch job and block until its results are ready."""
+        client = genai.Client(api_key=self.gemini_api_key)
+        request_config = {
+            "system_instruction": self.SYSTEM_PROMPT,
+            "temperature": self.temperature,
+            "max_output_tokens": self.max_tokens,
+        }
+        job = client.batches.create(
+            model=self.gemini_model,
+            src=[
+                {
+                    "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+                    "config": request_config,
+                }
+                for prompt in prompts
+            ],
+            config={"display_name": "sunny-ai-chunk-summaries"},
+        )
+        
+        deadline = time.monotonic() + self.batch_timeout
+        while job.state.name not in BATCH_DONE_STATES:
+            if time.monotonic() > deadline:
+                client.batches.cancel(name=job.name)
+                raise TimeoutError(f"Batch job {job.name} did not finish in time")
+            time.sleep(self.batch_poll_interval)
+            job = client.batches.get(name=job.name)
+        
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Batch job {job.name} ended in {job.state.name}")
+        
+        # Inline responses come back in request order
+        return [item.response.text for item in job.dest.inlined_responses]
 
-Transcript:
-{transcript[:8000]}
+    async def _generate_combined_summary(
+        self, transcript_head: str
+    ) -> Optional[Tuple[str, List[str], List[str], List[ActionItem]]]:
+        """Extract all summary fields with one structured JSON call.
+        
+        Returns None when the response is not a complete summary object.
+        """
+        prompt = SUMMARY_PROMPT.format(transcript=transcript_head)
+        
+        response = await self._call_llm(prompt, schema="summary")
+        data = _parse_json_object(response)
+        if data is None or not all(key in data for key in SUMMARY_SCHEMA["required"]):
+            logger.warning("Combined summary response incomplete, extracting fields separately")
+            return None
+        
+        exec_summary = str(data["executive_summary"] or "")
+        words = exec_summary.split()
+        if len(words) > 200:
+            exec_summary = " ".join(words[:200]) + "..."
+        
+        key_points = [
+            str(point).strip() for point in data["key_points"] or []
+            if len(str(point).strip()) > 5
+        ]
+        decisions = [
+            str(decision).strip() for decision in data["decisions"] or []
+            if len(str(decision).strip()) > 5
+            and "no explicit decisions" not in str(decision).lower()
+        ]
+        action_items = [
+            self._action_item_from_dict(item) for item in data["action_items"] or []
+            if isinstance(item, dict) and item.get("task")
+        ]
+        
+        return exec_summary.strip(), key_points[:10], decisions, action_items
 
-Executive Summary:"""
+    async def _generate_executive_summary(self, transcript_head: str) -> str:
+        """Generate executive summary (max 200 words)."""
+        prompt = EXECUTIVE_SUMMARY_PROMPT.format(transcript=transcript_head)
 
         response = await self._call_llm(prompt)
         
@@ -292,110 +885,82 @@ Executive Summary:"""
         
         return response.strip()
 
-    async def _extract_key_points(self, transcript: str) -> List[str]:
+    async def _extract_key_points(self, transcript_head: str) -> List[str]:
         """Extract key discussion points."""
-        prompt = f"""Extract the key discussion points from this meeting transcript.
-
-Requirements:
-- List 5-10 main topics or points discussed
-- Each point should be a single, clear sentence
-- Only include what was actually discussed
-- Format as a numbered list
-
-Transcript:
-{transcript[:8000]}
-
-Key Discussion Points:"""
+        prompt = KEY_POINTS_PROMPT.format(transcript=transcript_head)
 
         response = await self._call_llm(prompt)
         
         points = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line:
-                cleaned = re.sub(r'^[\d]+[\.\)]\s*', '', line)
-                cleaned = re.sub(r'^[-•*]\s*', '', cleaned)
-                if cleaned and len(cleaned) > 5:
-                    points.append(cleaned)
+        for line in _iter_lines(response):
+            cleaned = _LIST_MARKER.sub('', line, count=1)
+            if len(cleaned) > 5:
+                points.append(cleaned)
         
         return points[:10]
 
-    async def _extract_decisions(self, transcript: str) -> List[str]:
+    async def _extract_decisions(self, transcript_head: str) -> List[str]:
         """Extract decisions made during the meeting."""
-        prompt = f"""Extract any decisions that were made during this meeting.
-
-Requirements:
-- Only include explicit decisions that were agreed upon
-- Each decision should be a clear, actionable statement
-- If no clear decisions were made, respond with "No explicit decisions recorded"
-- Format as a numbered list
-
-Transcript:
-{transcript[:8000]}
-
-Decisions Made:"""
+        prompt = DECISIONS_PROMPT.format(transcript=transcript_head)
 
         response = await self._call_llm(prompt)
         
         decisions = []
-        for line in response.strip().split("\n"):
-            line = line.strip()
-            if line and "no explicit decisions" not in line.lower():
-                cleaned = re.sub(r'^[\d]+[\.\)]\s*', '', line)
-                cleaned = re.sub(r'^[-•*]\s*', '', cleaned)
-                if cleaned and len(cleaned) > 5:
+        for line in _iter_lines(response):
+            if "no explicit decisions" not in line.lower():
+                cleaned = _LIST_MARKER.sub('', line, count=1)
+                if len(cleaned) > 5:
                     decisions.append(cleaned)
         
         return decisions
 
-    async def _extract_action_items(self, transcript: str) -> List[ActionItem]:
+    async def _extract_action_items(self, transcript_head: str) -> List[ActionItem]:
         """Extract action items from the meeting."""
-        prompt = f"""Extract action items from this meeting transcript.
+        prompt = ACTION_ITEMS_PROMPT.format(transcript=transcript_head)
 
-For each action item, identify:
-- Task: What needs to be done
-- Owner: Who is responsible (if mentioned)
-- Deadline: When it's due (if mentioned)
-
-Format your response as JSON array:
-[
-  {{"task": "description", "owner": "name or null", "deadline": "date or null"}},
-  ...
-]
-
-If no action items, return: []
-
-Transcript:
-{transcript[:8000]}
-
-Action Items (JSON only, no other text):"""
-
-        response = await self._call_llm(prompt)
+        # Stream the response and materialize each item as soon as it closes,
+        # keeping the full text for the tolerant parser if streaming finds none
+        fragments: List[str] = []
+        
+        async def record(stream: AsyncIterator[str]) -> AsyncIterator[str]:
+            async for text in stream:
+                fragments.append(text)
+                yield text
         
         action_items = []
-        try:
-            json_match = re.search(r'\[[\s\S]*\]', response)
-            if json_match:
-                items = json.loads(json_match.group())
-                for item in items:
-                    if isinstance(item, dict) and item.get("task"):
-                        action_items.append(ActionItem(
-                            task=item.get("task", ""),
-                            owner=item.get("owner"),
-                            deadline=item.get("deadline"),
-                            priority=item.get("priority", "Medium")
-                        ))
-        except json.JSONDecodeError:
+        async for item in _iter_json_array_items(record(self._stream_llm(prompt, schema="action_items"))):
+            if item.get("task"):
+                action_items.append(self._action_item_from_dict(item))
+        
+        if action_items:
+            return action_items
+        
+        response = "".join(fragments)
+        items = _parse_json_array(response)
+        if items is not None:
+            for item in items:
+                if isinstance(item, dict) and item.get("task"):
+                    action_items.append(self._action_item_from_dict(item))
+        else:
             logger.warning("Could not parse action items as JSON, using text parsing")
-            for line in response.strip().split("\n"):
-                line = line.strip()
-                if line and not line.startswith("[") and not line.startswith("]"):
-                    cleaned = re.sub(r'^[\d]+[\.\)\-]\s*', '', line)
-                    if cleaned and len(cleaned) > 5:
+            for line in _iter_lines(response):
+                if not line.startswith(("[", "]")):
+                    cleaned = _ACTION_MARKER.sub('', line, count=1)
+                    if len(cleaned) > 5:
                         action_items.append(ActionItem(task=cleaned))
         
         return action_items
 
+    @staticmethod
+    def _action_item_from_dict(item: dict) -> ActionItem:
+        """Build an ActionItem from one parsed JSON object."""
+        return ActionItem(
+            task=item.get("task", ""),
+            owner=item.get("owner"),
+            deadline=item.get("deadline"),
+            priority=item.get("priority", "Medium")
+        )
+
     async def _generate_final_summary(
         self, 
         combined_summaries: str, 
@@ -403,26 +968,26 @@ Action Items (JSON only, no other text):"""
     ) -> MeetingSummary:
         """Generate final summary from combined chunk summaries."""
         
-        exec_prompt = f"""Based on these meeting summary parts, write a cohesive executive summary.
+        # Same transcript-first layout as the extraction prompts, so all four
+        # calls share the leading summaries as a prefix
+        summaries_head = combined_summaries[:PROMPT_TRANSCRIPT_CHARS]
+        exec_prompt = TRANSCRIPT_PREFIX.format(transcript=combined_summaries) + """The transcript above is a set of meeting summary parts. Write a cohesive executive summary.
 
 Requirements:
 - Maximum 200 words
 - Synthesize all parts into one coherent summary
 - Be factual and professional
 
-Summary Parts:
-{combined_summaries}
-
 Executive Summary:"""
-        
-        exec_summary = await self._call_llm(exec_prompt)
+        exec_summary, key_points, decisions, action_items = await asyncio.gather(
+            self._call_llm(exec_prompt),
+            self._extract_key_points(summaries_head),
+            self._extract_decisions(summaries_head),
+            self._extract_action_items(summaries_head)
+        )
         words = exec_summary.split()
         if len(words) > 200:
             exec_summary = " ".join(words[:200]) + "..."
-
-        key_points = await self._extract_key_points(combined_summaries)
-        decisions = await self._extract_decisions(combined_summaries)
-        action_items = await self._extract_action_items(combined_summaries)
         
         confidence = self._calculate_confidence(exec_summary, key_points, decisions, action_items)
 
@@ -467,4 +1032,7 @@ Executive Summary:"""
 
     async def close(self):
         """Cleanup resources."""
-        pass
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,135 @@
+"""
+Semantic Response Cache
+Reuses LLM responses for identical or near-identical prompts.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+@dataclass(slots=True)
+class _SemanticEntry:
+    namespace: str
+    embedding: np.ndarray
+    response: str
+    expires_at: float
+
+
+class SemanticCache:
+    """Two-level response cache: exact prompt hash first, then embedding similarity."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 1024,
+        semantic: bool = True,
+        model_name: str = "all-MiniLM-L6-v2"
+    ):
+        self.ttl = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self.model_name = model_name
+
+        self._exact: Dict[str, Tuple[float, str]] = {}
+        self._entries: List[_SemanticEntry] = []
+        self._embedding_model = None
+        self._model_unavailable = False
+
+    @staticmethod
+    def _key(namespace: str, prompt: str) -> str:
+        """Hash a prompt together with its namespace."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(namespace.encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+
+    def _load_model(self):
+        """Load the sentence transformer on first use."""
+        if self._embedding_model is None and not self._model_unavailable:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self._embedding_model = SentenceTransformer(self.model_name)
+            except ImportError:
+                logger.warning("sentence-transformers not installed, semantic cache disabled")
+                self._model_unavailable = True
+            except Exception as e:
+                logger.warning(f"Could not load cache embedding model: {e}")
+                self._model_unavailable = True
+        return self._embedding_model
+
+    def _embed(self, text: str) -> Optional[np.ndarray]:
+        """Return a unit-length embedding, or None without a model."""
+        model = self._load_model()
+        if model is None:
+            return None
+        return model.encode(text, normalize_embeddings=True)
+
+    async def get(self, prompt: str, namespace: str = "") -> Optional[str]:
+        """Return a cached response for the prompt, if any."""
+        now = time.monotonic()
+
+        hit = self._exact.get(self._key(namespace, prompt))
+        if hit and hit[0] > now:
+            return hit[1]
+
+        if not self.semantic or not self._entries:
+            return None
+
+        embedding = await asyncio.to_thread(self._embed, prompt)
+        if embedding is None:
+            return None
+
+        candidates = [
+            entry for entry in self._entries
+            if entry.namespace == namespace and entry.expires_at > now
+        ]
+        if not candidates:
+            return None
+
+        scores = np.stack([entry.embedding for entry in candidates]) @ embedding
+        best = int(np.argmax(scores))
+        if scores[best] >= self.similarity_threshold:
+            logger.debug(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return candidates[best].response
+        return None
+
+    async def put(self, prompt: str, response: str, namespace: str = "") -> None:
+        """Store a response for the prompt."""
+        now = time.monotonic()
+        expires_at = now + self.ttl
+        self._prune(now)
+
+        self._exact[self._key(namespace, prompt)] = (expires_at, response)
+
+        if self.semantic:
+            embedding = await asyncio.to_thread(self._embed, prompt)
+            if embedding is not None:
+                self._entries.append(_SemanticEntry(namespace, embedding, response, expires_at))
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        self._exact.clear()
+        self._entries.clear()
+
+    def _prune(self, now: float) -> None:
+        """Remove expired entries and keep each level under max_entries."""
+        self._exact = {
+            key: value for key, value in self._exact.items() if value[0] > now
+        }
+        while len(self._exact) >= self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._exact[next(iter(self._exact))]
+
+        self._entries = [entry for entry in self._entries if entry.expires_at > now]
+        if len(self._entries) >= self.max_entries:
+            self._entries = self._entries[-(self.max_entries - 1):]
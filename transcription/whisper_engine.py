@@ -4,8 +4,9 @@ Handles audio transcription using OpenAI Whisper (open-source).
 """
 
 import asyncio
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Union
 from dataclasses import dataclass, field
 from datetime import timedelta
 import numpy as np
@@ -13,6 +14,26 @@ import structlog
 
 logger = structlog.get_logger(__name__)
 
+# Sample rate faster-whisper expects for in-memory audio
+WHISPER_SAMPLE_RATE = 16000
+
+
+@lru_cache(maxsize=None)
+def _load_faster_whisper_model(model_size: str, device: str, compute_type: str):
+    """Load a faster-whisper model once per configuration and share it across engines."""
+    from faster_whisper import WhisperModel
+    
+    model = WhisperModel(model_size, device=device, compute_type=compute_type)
+    
+    # Preload the Silero VAD model so the first vad_filter call does not pay for it
+    try:
+        from faster_whisper.vad import get_vad_model
+        get_vad_model()
+    except Exception as e:
+        logger.warning(f"Could not preload VAD model: {e}")
+    
+    return model
+
 
 @dataclass
 class TranscriptionSegment:
@@ -51,8 +72,13 @@ class WhisperEngine:
         self.language = trans_config.get("language", "en")
         self.device = trans_config.get("device", "cpu")
         self.compute_type = trans_config.get("compute_type", "int8")
+        self.batch_size = trans_config.get("batch_size", 16)
+        # Greedy decoding on CPU; beam search only where a GPU makes it cheap
+        self.beam_size = trans_config.get("beam_size") or (1 if self.device == "cpu" else 5)
+        self.condition_on_previous_text = trans_config.get("condition_on_previous_text", False)
         
         self._model = None
+        self._pipeline = None
         self._use_faster_whisper = True
 
     async def load_model(self) -> None:
@@ -61,16 +87,20 @@ class WhisperEngine:
         
         try:
             # Try faster-whisper first (more efficient)
-            from faster_whisper import WhisperModel
-            
-            self._model = WhisperModel(
+            loop = asyncio.get_event_loop()
+            self._model = await loop.run_in_executor(
+                None,
+                _load_faster_whisper_model,
                 self.model_size,
-                device=self.device,
-                compute_type=self.compute_type
+                self.device,
+                self.compute_type
             )
             self._use_faster_whisper = True
             logger.info("Loaded faster-whisper model")
             
+            if self.batch_size > 1:
+                self._pipeline = self._create_batched_pipeline()
+            
         except ImportError:
             # Fall back to standard whisper
             import whisper
@@ -79,6 +109,17 @@ class WhisperEngine:
             self._use_faster_whisper = False
             logger.info("Loaded standard whisper model")
 
+    def _create_batched_pipeline(self):
+        """Wrap the faster-whisper model in a batched pipeline, if supported."""
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.warning("faster-whisper too old for batched inference (needs 1.1+), transcribing sequentially")
+            return None
+        
+        logger.info(f"Batched inference enabled (batch_size={self.batch_size})")
+        return BatchedInferencePipeline(model=self._model)
+
     async def transcribe(self, audio_path: Path) -> TranscriptionResult:
         """Transcribe an audio file."""
         if not self._model:
@@ -95,18 +136,35 @@ class WhisperEngine:
             logger.error(f"Transcription failed: {e}")
             raise
 
-    async def _transcribe_faster_whisper(self, audio_path: Path) -> TranscriptionResult:
-        """Transcribe using faster-whisper."""
+    async def _transcribe_faster_whisper(
+        self,
+        audio: Union[Path, np.ndarray]
+    ) -> TranscriptionResult:
+        """Transcribe a file path or 16 kHz float32 mono samples using faster-whisper."""
         loop = asyncio.get_event_loop()
         
         def _transcribe():
-            segments, info = self._model.transcribe(
-                str(audio_path),
+            kwargs = dict(
                 language=self.language,
-                beam_size=5,
+                beam_size=self.beam_size,
+                temperature=0,
+                word_timestamps=False,
                 vad_filter=True,
                 vad_parameters=dict(min_silence_duration_ms=500)
             )
+            source = audio if isinstance(audio, np.ndarray) else str(audio)
+            if self._pipeline is not None:
+                # VAD splits the audio into utterances that are decoded batch_size at a time
+                segments, info = self._pipeline.transcribe(
+                    source, batch_size=self.batch_size, **kwargs
+                )
+            else:
+                # Batched segments are decoded independently, so this only applies here
+                segments, info = self._model.transcribe(
+                    source,
+                    condition_on_previous_text=self.condition_on_previous_text,
+                    **kwargs
+                )
             return list(segments), info
 
         segments, info = await loop.run_in_executor(None, _transcribe)
@@ -141,6 +199,7 @@ class WhisperEngine:
             return self._model.transcribe(
                 str(audio_path),
                 language=self.language,
+                condition_on_previous_text=self.condition_on_previous_text,
                 verbose=False
             )
 
@@ -174,21 +233,16 @@ class WhisperEngine:
         if not segments:
             return segments
 
-        current_speaker = "Speaker 1"
-        speaker_count = 1
-        
         # Heuristic: Long pauses (>2s) or significant changes might indicate speaker change
-        for i, seg in enumerate(segments):
-            if i > 0:
-                gap = seg.start - segments[i-1].end
-                
-                # If there's a significant pause, might be a new speaker
-                if gap > 2.0:
-                    # Simple alternating speaker assignment
-                    speaker_count = (speaker_count % 4) + 1
-                    current_speaker = f"Speaker {speaker_count}"
-            
-            seg.speaker = current_speaker
+        starts = np.fromiter((seg.start for seg in segments), dtype=np.float64, count=len(segments))
+        ends = np.fromiter((seg.end for seg in segments), dtype=np.float64, count=len(segments))
+        gaps = starts[1:] - ends[:-1]
+        
+        # Simple alternating speaker assignment, cycling through four speakers
+        speaker_numbers = np.concatenate(([0], np.cumsum(gaps > 2.0))) % 4 + 1
+        
+        for seg, number in zip(segments, speaker_numbers.tolist()):
+            seg.speaker = f"Speaker {number}"
 
         return segments
 
@@ -201,12 +255,23 @@ class WhisperEngine:
         if not self._model:
             await self.load_model()
 
+        if self._use_faster_whisper and audio_chunks and sample_rate == WHISPER_SAMPLE_RATE:
+            # Chunks are contiguous, so one in-memory pass over the joined audio
+            # replaces the per-chunk temp-file round-trip and lets VAD and beam
+            # search run over the full recording
+            audio = np.concatenate([
+                chunk.mean(axis=1) if chunk.ndim > 1 else chunk
+                for chunk in audio_chunks
+            ]).astype(np.float32, copy=False)
+            logger.info(f"Transcribing {len(audio) / sample_rate:.1f}s of in-memory audio")
+            return await self._transcribe_faster_whisper(audio)
+
         all_segments = []
         full_text_parts = []
         time_offset = 0.0
 
         for chunk in audio_chunks:
-            # Save chunk to temp file (whisper requires file input)
+            # Save chunk to temp file (standard whisper path, or audio that needs resampling)
             import tempfile
             import soundfile as sf
             
@@ -4,10 +4,18 @@ Handles loading and validating configuration.
 """
 
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# A config value that is exactly ${VAR}
+_ENV_VAR = re.compile(r"^\$\{([^}]+)\}$")
+
 
 def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     """Load configuration from YAML file."""
@@ -16,11 +24,12 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(path, 'r') as f:
-        config = yaml.safe_load(f)
+    # The parsed file is cached until it changes on disk; env vars are expanded
+    # on every load, which also hands each caller its own copy
+    raw_config = _read_yaml(str(path.resolve()), path.stat().st_mtime_ns)
     
     # Expand environment variables
-    config = _expand_env_vars(config)
+    config = _expand_env_vars(raw_config)
     
     # Validate required sections
     _validate_config(config)
@@ -28,6 +37,13 @@ def load_config(config_path: str = "config.yaml") -> Dict[str, Any]:
     return config
 
 
+@lru_cache(maxsize=8)
+def _read_yaml(path: str, mtime_ns: int) -> Any:
+    """Parse a YAML file; mtime_ns keys the cache so edits are picked up."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 def _expand_env_vars(config: Any) -> Any:
     """Recursively expand environment variables in config values."""
     if isinstance(config, dict):
@@ -36,9 +52,10 @@ def _expand_env_vars(config: Any) -> Any:
         return [_expand_env_vars(item) for item in config]
     elif isinstance(config, str):
         # Expand ${VAR} patterns
-        if config.startswith("${") and config.endswith("}"):
-            var_name = config[2:-1]
-            return os.getenv(var_name, config)
+        if "${" in config:
+            match = _ENV_VAR.match(config)
+            if match:
+                return os.getenv(match.group(1), config)
         return config
     return config
 
@@ -65,6 +82,9 @@ def get_default_config() -> Dict[str, Any]:
             "max_duration_minutes": 180,
             "waiting_room_timeout_seconds": 300,
             "end_detection_interval_seconds": 10,
+            "navigation_timeout_ms": 15000,
+            "selector_timeout_ms": 3000,
+            "optional_selector_timeout_ms": 800,
             "auto_leave_on_end": True
         },
         "audio": {
@@ -77,7 +97,10 @@ def get_default_config() -> Dict[str, Any]:
             "model_size": "medium",
             "language": "en",
             "device": "cpu",
-            "compute_type": "int8"
+            "compute_type": "int8",
+            "batch_size": 16,
+            "beam_size": None,
+            "condition_on_previous_text": False
         },
         "summarization": {
             "ollama_base_url": "http://localhost:11434",
@@ -85,14 +108,24 @@ def get_default_config() -> Dict[str, Any]:
             "max_tokens": 2048,
             "temperature": 0.3,
             "chunk_size_tokens": 4000,
-            "overlap_tokens": 200
+            "overlap_tokens": 200,
+            "max_concurrent_requests": 4,
+            "mode": "realtime",
+            "batch_poll_interval_seconds": 30,
+            "batch_timeout_minutes": 120,
+            "cache_enabled": True,
+            "cache_ttl_seconds": 3600,
+            "semantic_cache": False,
+            "cache_similarity_threshold": 0.92
         },
         "pdf": {
             "font_family": "Helvetica",
             "title_font_size": 18,
             "heading_font_size": 14,
             "body_font_size": 11,
-            "margin": 50
+            "margin": 50,
+            "shape_checking": False,
+            "max_workers": None
         },
         "email": {
             "smtp_server": "smtp.gmail.com",
@@ -100,7 +133,7 @@ def get_default_config() -> Dict[str, Any]:
             "subject_template": "Meeting Summary - {date} - {platform}"
         },
         "browser": {
-            "headless": False,
+            "headless": True,
             "timeout_ms": 30000
         }
     }
@@ -0,0 +1,74 @@
+"""
+API Key Store
+Shares API keys set at runtime across server worker processes.
+
+Keys are stored in plain text, one file per key, under KEY_STORE_DIR. A stored
+key only overrides the environment variable of the same name if it was written
+after this process started, so rotating the variable and restarting wins over a
+key set through the API earlier. Delete the file (or call clear_api_key) to
+drop a runtime key.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Tuple
+
+# Directory holding one file per key; every worker on the host reads the same files
+KEY_STORE_DIR = Path(os.getenv("SUNNY_KEY_STORE_DIR", "./data/keys"))
+
+# name -> (mtime_ns, value), so a key file is only re-read after it changes
+_cache: Dict[str, Tuple[int, str]] = {}
+
+# Stored keys older than this defer to the environment
+_PROCESS_START_NS = time.time_ns()
+
+
+def store_api_key(name: str, value: str) -> None:
+    """Persist an API key so every worker picks it up on its next read."""
+    KEY_STORE_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Write to a private temp file and rename, so readers never see a partial key
+    fd, tmp_path = tempfile.mkstemp(dir=KEY_STORE_DIR, prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(value)
+        os.replace(tmp_path, KEY_STORE_DIR / name)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def clear_api_key(name: str) -> None:
+    """Remove a stored key so the environment variable applies again."""
+    try:
+        (KEY_STORE_DIR / name).unlink()
+    except FileNotFoundError:
+        pass
+    _cache.pop(name, None)
+
+
+def get_api_key(name: str) -> str:
+    """Return the current key for name.
+    
+    A key stored since this process started wins; otherwise the environment
+    variable does, with an older stored key used only when the variable is unset.
+    """
+    env_value = os.getenv(name, "")
+    path = KEY_STORE_DIR / name
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return env_value
+    
+    if env_value and mtime_ns < _PROCESS_START_NS:
+        return env_value
+
+    cached = _cache.get(name)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    value = path.read_text().strip()
+    _cache[name] = (mtime_ns, value)
+    return value
@@ -4,11 +4,27 @@ Sets up structured logging for the application.
 """
 
 import sys
+import json
+import atexit
 import logging
+import logging.handlers
+import queue
 from pathlib import Path
 from datetime import datetime
 import structlog
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj, default=None, **kwargs) -> str:
+    """Serialize a log event, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default).decode()
+    return json.dumps(obj, default=default, **kwargs)
+
 
 def setup_logging(log_level: str = "INFO", log_dir: str = "./logs") -> None:
     """Setup structured logging."""
@@ -21,28 +37,52 @@ def setup_logging(log_level: str = "INFO", log_dir: str = "./logs") -> None:
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = log_path / f"sunny_ai_{timestamp}.log"
     
+    # Processors shared by structlog events and records from plain stdlib loggers
+    shared_processors = [
+        structlog.stdlib.add_logger_name,
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.PositionalArgumentsFormatter(),
+        structlog.processors.TimeStamper(fmt="iso"),
+        structlog.processors.StackInfoRenderer(),
+        structlog.processors.format_exc_info,
+        structlog.processors.UnicodeDecoder(),
+    ]
+    
+    # Human-readable output on stdout, colored only for a terminal
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processor=structlog.dev.ConsoleRenderer(colors=sys.stdout.isatty()),
+        foreign_pre_chain=shared_processors,
+    ))
+    
+    # JSON lines for the log file; records are rendered by the queue handler
+    # and written by a background thread so callers never wait on disk I/O
+    file_handler = logging.FileHandler(log_file)
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processor=structlog.processors.JSONRenderer(serializer=_dumps),
+        foreign_pre_chain=shared_processors,
+    ))
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Configure standard logging
     logging.basicConfig(
-        format="%(message)s",
         level=getattr(logging, log_level.upper()),
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler(log_file)
-        ]
+        handlers=[console_handler, queue_handler]
     )
     
     # Configure structlog
     structlog.configure(
         processors=[
             structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.PositionalArgumentsFormatter(),
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.dev.ConsoleRenderer(colors=True)
+            *shared_processors,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
         ],
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
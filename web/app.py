@@ -4,27 +4,42 @@ Beautiful web interface for the meeting assistant.
 """
 
 import asyncio
+import hashlib
+import hmac
+import importlib.util
+import math
 import sys
 import os
+import time
+from functools import partial
 from pathlib import Path
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
 
 # Add parent to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from fastapi import FastAPI, HTTPException, Request
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi import Depends, FastAPI, HTTPException, Request
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from pydantic import BaseModel, EmailStr
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from pydantic import BaseModel, ConfigDict, EmailStr
+from typing_extensions import TypedDict  # Pydantic requires this version before 3.12
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import SlowAPIMiddleware
+from slowapi.util import get_remote_address
+import orjson
 import uvicorn
 import structlog
 
 from utils.config import load_config, get_default_config
 from utils.logger import setup_logging
+from utils.key_store import get_api_key, store_api_key
 from controller import SunnyAIController
 
 logger = structlog.get_logger(__name__)
@@ -38,7 +53,8 @@ app = FastAPI(
     title="Sunny AI",
     description="Autonomous Meeting Assistant",
     docs_url="/docs" if not IS_PRODUCTION else None,  # Disable docs in production
-    redoc_url="/redoc" if not IS_PRODUCTION else None
+    redoc_url="/redoc" if not IS_PRODUCTION else None,
+    default_response_class=ORJSONResponse  # orjson encodes large transcripts much faster
 )
 
 # Security Middleware
@@ -54,29 +70,184 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON payloads such as transcripts and analytics
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+# Number of reverse proxies in front of the app that append to X-Forwarded-For.
+# 0 (the default) when clients connect directly; set it per deployment, e.g. 1
+# behind Railway, Fly.io, Hugging Face Spaces or the bundled nginx
+TRUSTED_PROXY_HOPS = int(os.getenv("TRUSTED_PROXY_HOPS", "0"))
+
+
+def client_address(request: Request) -> str:
+    """Rate-limit key: the address the outermost trusted proxy saw.
+    
+    Entries left of that one are supplied by the client and can be forged,
+    so only the hop appended by our own proxies is used.
+    """
+    if TRUSTED_PROXY_HOPS:
+        hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+        if len(hops) >= TRUSTED_PROXY_HOPS:
+            return hops[-TRUSTED_PROXY_HOPS]
+    return get_remote_address(request)
+
+
+# Per-client rate limits on endpoints that spend LLM calls; the middleware
+# rejects excess requests before the body is parsed or validated
+limiter = Limiter(key_func=client_address)
+app.state.limiter = limiter
+app.add_middleware(SlowAPIMiddleware)
+
+
+@app.exception_handler(RateLimitExceeded)
+def rate_limit_exceeded(request: Request, exc: RateLimitExceeded) -> ORJSONResponse:
+    """Reject with 429 and tell the client how long until its window resets."""
+    try:
+        # slowapi records the limit and its keys on the request before raising
+        limit_item, keys = request.state.view_rate_limit
+        reset_at = limiter.limiter.get_window_stats(limit_item, *keys)[0]
+        retry_after = max(1, math.ceil(reset_at - time.time()))
+    except AttributeError:
+        retry_after = exc.limit.limit.get_expiry()
+    return ORJSONResponse(
+        {"detail": f"Rate limit exceeded: {exc.detail}"},
+        status_code=429,
+        headers={"Retry-After": str(retry_after)}
+    )
+
 # Templates
 templates_dir = Path(__file__).parent / "templates"
-templates = Jinja2Templates(directory=str(templates_dir))
+# Compiled once and kept: no per-request mtime checks outside development,
+# and bytecode is reused across restarts
+template_env = Environment(
+    loader=FileSystemLoader(str(templates_dir)),
+    autoescape=True,
+    auto_reload=not IS_PRODUCTION,
+    cache_size=-1,
+    bytecode_cache=FileSystemBytecodeCache()
+)
+templates = Jinja2Templates(env=template_env)
+template_env.get_template("index.html")
+
+# Static assets are served with ETag/304 by starlette and cached by browsers
+# for a year, so rename or version (?v=) an asset whenever it changes
+static_dir = Path(__file__).parent / "static"
+STATIC_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that marks every served asset as long-lived."""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = STATIC_CACHE_CONTROL
+        return response
 
-# Global controller
-controller: Optional[SunnyAIController] = None
+
+if static_dir.is_dir():
+    app.mount("/static", CachedStaticFiles(directory=str(static_dir)), name="static")
+
+# Loaded config; the controller lives on app.state so it is explicit per worker
 config: dict = {}
+app.state.controller = None
+
+# LLM availability, refreshed in the background so health checks never wait on it
+LLM_HEALTH_INTERVAL = 15
+app.state.llm_available = False
+app.state.llm_health_task = None
+
+
+def get_controller() -> SunnyAIController:
+    """Dependency returning the initialized controller, or 503 without one."""
+    controller = app.state.controller
+    if controller is None:
+        raise HTTPException(status_code=503, detail="Controller not initialized")
+    return controller
+
+# Seconds a cached read stays fresh; completed sessions no longer change
+READ_CACHE_TTL = 30
+COMPLETED_CACHE_TTL = 3600
+
+
+class ResponseCache:
+    """In-process TTL cache for read endpoints, keyed by (endpoint, session_id)."""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._entries: Dict[Tuple[str, int], Tuple[float, Any]] = {}
+
+    def get(self, key: Tuple[str, int]) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: Tuple[str, int], value: Any, ttl: float) -> None:
+        if len(self._entries) >= self.maxsize:
+            # Dicts keep insertion order, so the first key is the oldest
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+    def invalidate_session(self, session_id: int) -> None:
+        for key in [key for key in self._entries if key[1] == session_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache()
+
+
+async def _cached_read(
+    controller: SunnyAIController,
+    endpoint: str,
+    session_id: int,
+    load: Callable[[], Awaitable[Optional[Any]]]
+) -> Optional[Any]:
+    """Return a cached endpoint result, loading and caching it on a miss.
+    
+    Empty results are not cached, so data that appears later is picked up.
+    """
+    key = (endpoint, session_id)
+    cached = response_cache.get(key)
+    if cached is not None:
+        return cached
+    
+    result = await load()
+    if result:
+        status = await controller.get_session_status(session_id) if session_id > 0 else None
+        completed = bool(status) and status.get("status") == "completed"
+        response_cache.set(key, result, COMPLETED_CACHE_TTL if completed else READ_CACHE_TTL)
+    return result
 
 
 # Request Models
+# Request bodies are read-only once parsed; unknown fields are dropped
+REQUEST_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore", str_strip_whitespace=True)
+
+
 class MeetingRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     meeting_url: str
     recipient_email: EmailStr
     send_email: bool = True
 
 
-class MeetingResponse(BaseModel):
+# Outgoing only, so a plain dict type avoids building and validating a model
+class MeetingResponse(TypedDict):
     session_id: int
     status: str
     message: str
 
 
 class ApiKeyRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     api_key: str
 
 
@@ -87,26 +258,33 @@ async def home(request: Request):
     return templates.TemplateResponse("index.html", {"request": request})
 
 
+# (iso string, epoch second) so frequent health probes format once per second
+_cached_iso: Tuple[str, int] = ("", 0)
+
+
+def iso_now() -> str:
+    """Current UTC time as an ISO 8601 string, at one-second resolution."""
+    global _cached_iso
+    now = int(time.time())
+    if now != _cached_iso[1]:
+        _cached_iso = (datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"), now)
+    return _cached_iso[0]
+
+
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
     try:
-        global controller
+        controller = app.state.controller
         
-        gemini_configured = bool(os.getenv("GEMINI_API_KEY"))
-        llm_available = False
+        gemini_configured = bool(get_api_key("GEMINI_API_KEY"))
+        llm_available = app.state.llm_available
         controller_ready = controller is not None
         
-        if controller:
-            try:
-                llm_available = await controller.summarizer.check_available()
-            except Exception as e:
-                logger.warning(f"LLM check failed: {e}")
-        
         return {
             "status": "healthy",
             "service": "Sunny AI",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "gemini_configured": gemini_configured,
             "llm_available": llm_available,
             "controller_ready": controller_ready,
@@ -117,32 +295,54 @@ async def health_check():
         return {
             "status": "healthy",
             "service": "Sunny AI",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": iso_now(),
             "error": str(e)
         }
 
 
+# Strong references so fire-and-forget cleanup tasks are not garbage collected
+_background_tasks: set = set()
+
+
+def _cleanup_in_background(controller: SunnyAIController) -> None:
+    """Release a controller that is no longer served, off the request path."""
+    task = asyncio.create_task(controller.cleanup())
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+def _key_digest(key: str) -> bytes:
+    """Short blake2b digest of an API key, for comparisons."""
+    return hashlib.blake2b(key.encode(), digest_size=16).digest()
+
+
 @app.post("/api/config/apikey")
 async def set_api_key(request: ApiKeyRequest):
     """Set the Gemini API key."""
-    global controller, config
-    
-    # Only reinitialize if key is different or not set
-    current_key = os.getenv("GEMINI_API_KEY", "")
-    if current_key == request.api_key:
+    # Compare fixed-size digests in constant time rather than the raw keys
+    if hmac.compare_digest(_key_digest(get_api_key("GEMINI_API_KEY")), _key_digest(request.api_key)):
         return {"status": "success", "message": "API key already configured"}
     
+    # The shared key store reaches every worker; each summarizer re-initializes
+    # Gemini on its next call instead of the whole controller being rebuilt
+    store_api_key("GEMINI_API_KEY", request.api_key)
     os.environ["GEMINI_API_KEY"] = request.api_key
     
-    # Reinitialize controller with new key
-    if controller:
-        await controller.cleanup()
-    
-    controller = SunnyAIController(config)
-    await controller.initialize()
+    controller = app.state.controller
+    if controller is None:
+        # Initialize fully before publishing, then swap in one assignment
+        controller = SunnyAIController(config)
+        await controller.initialize()
+        if app.state.controller is None:
+            app.state.controller = controller
+        else:
+            # A concurrent request won the race; retire ours without waiting on it
+            _cleanup_in_background(controller)
+            controller = app.state.controller
     
     # Check if it works
     available = await controller.summarizer.check_available()
+    app.state.llm_available = available
     
     if available:
         return {"status": "success", "message": "API key configured successfully"}
@@ -151,38 +351,37 @@ async def set_api_key(request: ApiKeyRequest):
 
 
 @app.post("/api/meetings/join", response_model=MeetingResponse)
-async def join_meeting(request: MeetingRequest):
+@limiter.limit("5/minute")
+async def join_meeting(
+    request: Request,
+    body: MeetingRequest,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Join a meeting and start recording."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
     try:
         session_id = await controller.start_session(
-            meeting_url=request.meeting_url,
-            recipient_email=request.recipient_email,
-            send_email=request.send_email
+            meeting_url=body.meeting_url,
+            recipient_email=body.recipient_email,
+            send_email=body.send_email
         )
         
-        return MeetingResponse(
+        # Returning a response directly skips FastAPI's second pass over response_model
+        return ORJSONResponse(MeetingResponse(
             session_id=session_id,
             status="joining",
             message="Sunny AI is joining the meeting"
-        )
+        ))
     except Exception as e:
         logger.error(f"Failed to join meeting: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/meetings/{session_id}/status")
-async def get_status(session_id: int):
+async def get_status(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get meeting session status."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
     status = await controller.get_session_status(session_id)
     
     if not status:
@@ -192,29 +391,26 @@ async def get_status(session_id: int):
 
 
 @app.post("/api/meetings/{session_id}/stop")
-async def stop_meeting(session_id: int):
+async def stop_meeting(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Stop a meeting session."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
     try:
         await controller.stop_session(session_id)
+        response_cache.invalidate_session(session_id)
         return {"status": "stopped", "session_id": session_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/meetings/{session_id}/transcript")
-async def get_transcript(session_id: int):
+async def get_transcript(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get meeting transcript."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    transcript = await controller.get_transcript(session_id)
+    transcript = await _cached_read(controller, "transcript", session_id, lambda: controller.get_transcript(session_id))
     
     if not transcript:
         raise HTTPException(status_code=404, detail="Transcript not available")
@@ -223,14 +419,12 @@ async def get_transcript(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/summary")
-async def get_summary(session_id: int):
+async def get_summary(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get meeting summary."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    summary = await controller.get_summary(session_id)
+    summary = await _cached_read(controller, "summary", session_id, lambda: controller.get_summary(session_id))
     
     if not summary:
         raise HTTPException(status_code=404, detail="Summary not available")
@@ -239,34 +433,84 @@ async def get_summary(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/pdf")
-async def download_pdf(session_id: int):
+async def download_pdf(
+    session_id: int,
+    request: Request,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Download meeting summary PDF."""
-    global controller
+    # Re-renders a missing report in a worker thread, off the event loop
+    pdf_path = await controller.ensure_pdf(session_id)
     
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
+    # One stat serves the existence check, Content-Length and the ETag
+    try:
+        stat_result = os.stat(pdf_path) if pdf_path else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
+        raise HTTPException(status_code=404, detail="PDF not available")
     
-    pdf_path = await controller.get_pdf_path(session_id)
+    etag_base = f"{pdf_path}:{stat_result.st_mtime_ns}:{stat_result.st_size}"
+    etag = f'"{hashlib.sha1(etag_base.encode(), usedforsecurity=False).hexdigest()}"'
+    cache_headers = {"ETag": etag, "Cache-Control": "private, max-age=86400"}
     
-    if not pdf_path or not Path(pdf_path).exists():
-        raise HTTPException(status_code=404, detail="PDF not available")
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=cache_headers)
     
     return FileResponse(
         pdf_path,
         media_type="application/pdf",
-        filename=Path(pdf_path).name
+        filename=Path(pdf_path).name,
+        stat_result=stat_result,
+        headers=cache_headers
     )
 
 
-@app.get("/api/meetings/recent")
-async def get_recent():
-    """Get recent meetings."""
-    global controller
+# Seconds between SSE keep-alive comments on an idle status stream
+STATUS_STREAM_KEEPALIVE = 15
+
+
+@app.get("/api/meetings/stream")
+async def stream_status(
+    request: Request,
+    session_id: Optional[int] = None,
+    controller: SunnyAIController = Depends(get_controller)
+):
+    """Push session status changes as Server-Sent Events instead of polling.
     
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
+    Streams every session, or only session_id when given.
+    """
+    queue = controller.subscribe_status(session_id)
     
-    meetings = await controller.get_recent_meetings(10)
+    async def events():
+        try:
+            while not await request.is_disconnected():
+                try:
+                    status = await asyncio.wait_for(queue.get(), STATUS_STREAM_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                yield f"event: status\ndata: {orjson.dumps(status).decode()}\n\n"
+        finally:
+            controller.unsubscribe_status(session_id, queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        # GZipMiddleware buffers a stream until it ends; an explicit encoding
+        # makes it pass events through so each one reaches the client at once
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", "Content-Encoding": "identity"}
+    )
+
+
+@app.get("/api/meetings/recent")
+async def get_recent(controller: SunnyAIController = Depends(get_controller)):
+    """Get recent meetings."""
+    # Not tied to one session, so it always uses the short TTL
+    meetings = response_cache.get(("recent", 0))
+    if meetings is None:
+        meetings = await controller.get_recent_meetings(10)
+        response_cache.set(("recent", 0), meetings, READ_CACHE_TTL)
     return {"meetings": meetings}
 
 
@@ -274,14 +518,12 @@ async def get_recent():
 # ================================
 
 @app.get("/api/meetings/{session_id}/analytics")
-async def get_analytics(session_id: int):
+async def get_analytics(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get meeting analytics."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    analytics = await controller.get_analytics(session_id)
+    analytics = await _cached_read(controller, "analytics", session_id, lambda: controller.get_analytics(session_id))
     
     if not analytics:
         raise HTTPException(status_code=404, detail="Analytics not available")
@@ -290,14 +532,12 @@ async def get_analytics(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/diarization")
-async def get_diarization(session_id: int):
+async def get_diarization(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get speaker diarization results."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    diarization = await controller.get_diarization(session_id)
+    diarization = await _cached_read(controller, "diarization", session_id, lambda: controller.get_diarization(session_id))
     
     if not diarization:
         raise HTTPException(status_code=404, detail="Diarization not available")
@@ -306,14 +546,12 @@ async def get_diarization(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/topics")
-async def get_topics(session_id: int):
+async def get_topics(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get topic segmentation results."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    topics = await controller.get_topics(session_id)
+    topics = await _cached_read(controller, "topics", session_id, lambda: controller.get_topics(session_id))
     
     if not topics:
         raise HTTPException(status_code=404, detail="Topics not available")
@@ -322,14 +560,12 @@ async def get_topics(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/sentiment")
-async def get_sentiment(session_id: int):
+async def get_sentiment(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get sentiment analysis results."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    sentiment = await controller.get_sentiment(session_id)
+    sentiment = await _cached_read(controller, "sentiment", session_id, lambda: controller.get_sentiment(session_id))
     
     if not sentiment:
         raise HTTPException(status_code=404, detail="Sentiment analysis not available")
@@ -338,14 +574,12 @@ async def get_sentiment(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/action-items")
-async def get_action_items(session_id: int):
+async def get_action_items(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get extracted action items."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    action_items = await controller.get_action_items(session_id)
+    action_items = await _cached_read(controller, "action-items", session_id, lambda: controller.get_action_items(session_id))
     
     if not action_items:
         raise HTTPException(status_code=404, detail="Action items not available")
@@ -354,14 +588,12 @@ async def get_action_items(session_id: int):
 
 
 @app.get("/api/meetings/{session_id}/followup-email")
-async def get_followup_email(session_id: int):
+async def get_followup_email(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Get generated follow-up email."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    email = await controller.get_followup_email(session_id)
+    email = await _cached_read(controller, "followup-email", session_id, lambda: controller.get_followup_email(session_id))
     
     if not email:
         raise HTTPException(status_code=404, detail="Follow-up email not available")
@@ -369,50 +601,106 @@ async def get_followup_email(session_id: int):
     return email
 
 
+# Reads the meeting page makes together: bundle key -> (cache endpoint, controller method)
+BUNDLE_READS = {
+    "transcript": ("transcript", "get_transcript"),
+    "summary": ("summary", "get_summary"),
+    "analytics": ("analytics", "get_analytics"),
+    "sentiment": ("sentiment", "get_sentiment"),
+    "action_items": ("action-items", "get_action_items"),
+}
+
+
+@app.get("/api/meetings/{session_id}/bundle")
+async def get_bundle(
+    session_id: int,
+    controller: SunnyAIController = Depends(get_controller)
+):
+    """Get transcript, summary, analytics, sentiment and action items in one request.
+    
+    Reads run concurrently and share the per-endpoint cache; parts that are
+    unavailable or fail to load are returned as None.
+    """
+    results = await asyncio.gather(
+        *(
+            _cached_read(controller, endpoint, session_id, partial(getattr(controller, method), session_id))
+            for endpoint, method in BUNDLE_READS.values()
+        ),
+        return_exceptions=True
+    )
+    
+    bundle = {}
+    for name, result in zip(BUNDLE_READS, results):
+        if isinstance(result, Exception):
+            logger.warning(f"Bundle read {name} failed for session {session_id}: {result}")
+            result = None
+        bundle[name] = result or None
+    return bundle
+
+
 class MemorySearchRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     query: str
     n_results: int = 5
     doc_type: Optional[str] = None
 
 
 @app.post("/api/memory/search")
-async def search_memory(request: MemorySearchRequest):
+@limiter.limit("10/minute")
+async def search_memory(
+    request: Request,
+    body: MemorySearchRequest,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Search meeting memory."""
-    global controller
-    
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
     results = await controller.search_memory(
-        query=request.query,
-        n_results=request.n_results,
-        doc_type=request.doc_type
+        query=body.query,
+        n_results=body.n_results,
+        doc_type=body.doc_type
     )
     
     return {"results": results}
 
 
 class MemoryQuestionRequest(BaseModel):
+    model_config = REQUEST_MODEL_CONFIG
+
     question: str
+    force_refresh: bool = False  # Bypass answers cached for similar questions
 
 
 @app.post("/api/memory/ask")
-async def ask_memory(request: MemoryQuestionRequest):
+@limiter.limit("10/minute")
+async def ask_memory(
+    request: Request,
+    body: MemoryQuestionRequest,
+    controller: SunnyAIController = Depends(get_controller)
+):
     """Ask a question about past meetings using RAG."""
-    global controller
+    answer = await controller.ask_memory(body.question, body.force_refresh)
     
-    if not controller:
-        raise HTTPException(status_code=503, detail="Controller not initialized")
-    
-    answer = await controller.ask_memory(request.question)
-    
-    return {"question": request.question, "answer": answer}
+    return {"question": body.question, "answer": answer}
+
+
+async def _refresh_llm_health_loop() -> None:
+    """Periodically record whether the LLM provider is reachable."""
+    while True:
+        controller = app.state.controller
+        available = False
+        if controller:
+            try:
+                available = await controller.summarizer.check_available()
+            except Exception as e:
+                logger.warning(f"LLM check failed: {e}")
+        app.state.llm_available = available
+        await asyncio.sleep(LLM_HEALTH_INTERVAL)
 
 
 @app.on_event("startup")
 async def startup():
     """Initialize controller on startup."""
-    global controller, config
+    global config
     
     try:
         setup_logging("INFO")
@@ -430,12 +718,15 @@ async def startup():
         try:
             controller = SunnyAIController(config)
             await controller.initialize()
+            app.state.controller = controller
             logger.info("Controller initialized successfully")
         except Exception as e:
             logger.error(f"Controller initialization failed: {e}")
             logger.warning("Starting with limited functionality")
             # Don't fail startup, just log the error
-            controller = None
+            app.state.controller = None
+        
+        app.state.llm_health_task = asyncio.create_task(_refresh_llm_health_loop())
         
         logger.info("Sunny AI Web Server started")
         
@@ -447,10 +738,11 @@ async def startup():
 @app.on_event("shutdown")
 async def shutdown():
     """Cleanup on shutdown."""
-    global controller
+    if app.state.llm_health_task:
+        app.state.llm_health_task.cancel()
     
-    if controller:
-        await controller.cleanup()
+    if app.state.controller:
+        await app.state.controller.cleanup()
     
     logger.info("Sunny AI Web Server stopped")
 
@@ -474,6 +766,11 @@ def main():
     
     print("\nPress Ctrl+C to stop the server.\n")
     
+    # Prefer uvloop and the httptools parser; fall back where they are not
+    # installed (uvloop does not support Windows)
+    loop = "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    http = "httptools" if importlib.util.find_spec("httptools") else "h11"
+    
     uvicorn.run(
         "web.app:app",
         host=host,
@@ -481,7 +778,9 @@ def main():
         reload=not IS_PRODUCTION,
         workers=workers if IS_PRODUCTION else 1,
         log_level="warning" if IS_PRODUCTION else "info",
-        access_log=not IS_PRODUCTION
+        access_log=not IS_PRODUCTION,
+        loop=loop,
+        http=http
     )
 
 